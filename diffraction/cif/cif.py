@@ -24,8 +24,11 @@ CIFParseError:
 """
 
 import collections
+from functools import lru_cache
+import os
 import re
-from typing import Dict, List, Pattern, Union
+import sys
+from typing import Dict, Iterator, List, Pattern, Union
 import warnings
 
 
@@ -53,6 +56,10 @@ def load_cif(filepath: str) -> Dict[str, Dict[str, DataItem]]:
         key: value pairs as above but where the value is now a list of
         one or more data values assigned to that data name in the loop.
 
+    Parsed files are cached by filepath, modification time and size,
+    so loading an unchanged file again does not parse it again. A
+    fresh copy of the data is returned each time.
+
     Parameters
     ----------
     filepath
@@ -109,12 +116,38 @@ def load_cif(filepath: str) -> Dict[str, Dict[str, DataItem]]:
     if not filepath.lower().endswith('.cif'):
         warnings.warn(("No .cif file extension detected. Assuming the filetype"
                        "is CIF and continuing."), UserWarning)
+    filepath = os.path.abspath(filepath)
+    try:
+        file_status = os.stat(filepath)
+    except OSError:
+        # let the parser raise the appropriate error on opening the file
+        return _parse_cif(filepath)
+    cif_data = _load_parsed_cif(filepath, file_status.st_mtime_ns, file_status.st_size)
+    # copy the cached data so callers are free to modify what is returned
+    return {header: {data_name: (list(data_value) if isinstance(data_value, list)
+                                 else data_value)
+                     for data_name, data_value in data_items.items()}
+            for header, data_items in cif_data.items()}
+
+
+def _parse_cif(filepath: str) -> Dict[str, Dict[str, DataItem]]:
+    """Parse a :term:`CIF` and return its data items by data block."""
     p = CIFParser(filepath)
     p.parse()
     return dict((data_block.header, data_block.data_items)
                 for data_block in p.data_blocks)
 
 
+@lru_cache(maxsize=32)
+def _load_parsed_cif(filepath: str,
+                     modification_time: int,
+                     size: int) -> Dict[str, Dict[str, DataItem]]:
+    """Parse a :term:`CIF`, caching the result by filepath and the
+    modification time and size of the file, so a file is only parsed
+    again once it has changed."""
+    return _parse_cif(filepath)
+
+
 def validate_cif(filepath: str) -> bool:
     """Validate :term:`CIF` syntax
 
@@ -165,19 +198,20 @@ def validate_cif(filepath: str) -> bool:
 
 
 # Regular expressions used for parsing.
-COMMENT_OR_BLANK = re.compile("\w*#.*|\s+$|^$")
-DATA_BLOCK_HEADER = re.compile("(?:^|\n)(data_\S*)\s*", re.IGNORECASE)
-LOOP = re.compile("(?:^|\n)loop_\s*", re.IGNORECASE)
-DATA_NAME = re.compile("\s*_(\S+)")
-DATA_NAME_START_LINE = re.compile("(?:^|\n)\s*_(\S+)")
-DATA_VALUE = re.compile("\s*(\'[^\']+\'|\"[^\"]+\"|[^\s_#][^\s\'\"]*)")
-
-DATA_VALUE_QUOTES = re.compile("^[\"\']?(.*?)[\"\']?$", re.DOTALL)
-TEXT_FIELD = re.compile("[^_][^;]+")
+COMMENT_OR_BLANK = re.compile(r"\w*#.*|\s+$|^$")
+COMMENT_OR_BLANK_LINE = re.compile(r"^(?:\w*#[^\n]*|[^\S\n]*)(?:\n|\Z)", re.MULTILINE)
+DATA_BLOCK_HEADER = re.compile(r"(?:^|\n)(data_\S*)\s*", re.IGNORECASE)
+LOOP = re.compile(r"(?:^|\n)loop_\s*", re.IGNORECASE)
+DATA_NAME = re.compile(r"\s*_(\S+)")
+DATA_NAME_START_LINE = re.compile(r"(?:^|\n)\s*_(\S+)")
+DATA_VALUE = re.compile(r"""\s*('[^']+'|"[^"]+"|[^\s_#][^\s'"]*)""")
+
+DATA_VALUE_QUOTES = re.compile(r"""^["']?(.*?)["']?$""", re.DOTALL)
+TEXT_FIELD = re.compile(r"[^_][^;]+")
 SEMICOLON_DATA_ITEM = re.compile(
-    "(?:^|\n){0.pattern}\n;\n((?:.(?<!\n;))*)\n;".format(DATA_NAME), re.DOTALL)
+    r"(?:^|\n){0.pattern}\n;\n((?:.(?<!\n;))*)\n;".format(DATA_NAME), re.DOTALL)
 INLINE_DATA_ITEM = re.compile(
-    "(?:^|\n){0.pattern}[^\S\n]+{1.pattern}".format(DATA_NAME, DATA_VALUE))
+    r"(?:^|\n){0.pattern}[^\S\n]+{1.pattern}".format(DATA_NAME, DATA_VALUE))
 
 
 def strip_quotes(data_value: str) -> str:
@@ -208,7 +242,9 @@ class DataBlock:
             out after extraction.
         data_items: dict
             A dictionary in which the :term:`data items` are stored
-            as :term:`data name`: :term:`data value` pairs.
+            as :term:`data name`: :term:`data value` pairs. The data
+            names are interned, as the same names recur across data
+            blocks and files.
 
     """
     def __init__(self, header: str, raw_data: str) -> None:
@@ -233,14 +269,65 @@ class DataBlock:
 
         Notes
         -----
-        Only used for inline and semicolon :term:`data items`. However,
-        any valid `data_item_pattern` should work.
+        Used by the parser for inline :term:`data items`, semicolon
+        data items having their own `extract_semicolon_data_items`.
+        However, any valid `data_item_pattern` should work.
         """
         data_items = data_item_pattern.findall(self.raw_data)
         for data_name, data_value in data_items:
-            self.data_items[data_name] = strip_quotes(data_value)
+            self.data_items[sys.intern(data_name)] = strip_quotes(data_value)
         self.raw_data = data_item_pattern.sub("", self.raw_data)
 
+    def extract_semicolon_data_items(self) -> None:
+        """Extract all :term:`semicolon data items` from raw data.
+
+        A single scan is made over the lines of `raw_data`. A
+        :term:`data name` alone on a line, followed by a line holding
+        only ``;``, opens a :term:`semicolon text field` which is
+        closed by the next line beginning with ``;``. The data items
+        are saved in the `data_item` dictionary and stripped out of
+        `raw_data`, exactly as `extract_data_items` does when given
+        the `SEMICOLON_DATA_ITEM` pattern.
+        """
+        lines = self.raw_data.split("\n")
+        remaining_lines = []
+        # whitespace-only lines directly preceding a data item are
+        # stripped out along with it
+        trailing_blank_lines = 0
+        i, number_of_lines = 0, len(lines)
+        while i < number_of_lines:
+            line = lines[i]
+            data_name = None
+            if i + 1 < number_of_lines and lines[i + 1] == ";":
+                data_name = DATA_NAME.fullmatch(line)
+            if data_name is not None:
+                closing_line = i + 2
+                while (closing_line < number_of_lines and
+                       not lines[closing_line].startswith(";")):
+                    closing_line += 1
+                if not i + 3 <= closing_line < number_of_lines:
+                    data_name = None
+            if data_name is None:
+                remaining_lines.append(line)
+                if line.isspace() or not line:
+                    trailing_blank_lines += 1
+                else:
+                    trailing_blank_lines = 0
+                i += 1
+                continue
+            self.data_items[sys.intern(data_name.group(1))] = strip_quotes(
+                "\n".join(lines[i + 2:closing_line]))
+            if trailing_blank_lines:
+                del remaining_lines[-trailing_blank_lines:]
+                trailing_blank_lines = 0
+            # anything after the closing semicolon joins the previous line
+            if remaining_lines:
+                remaining_lines[-1] += lines[closing_line][1:]
+            else:
+                remaining_lines.append(lines[closing_line][1:])
+            i = closing_line + 1
+        self.raw_data = "\n".join(remaining_lines)
+
     def extract_loop_data_items(self) -> None:
         """Extract all :term:`loop` :term:`data items` from raw data.
 
@@ -254,16 +341,17 @@ class DataBlock:
              "data_name_B": ["data_value_B1", "data_value_B2", ...]}
 
         """
+        find_data_values = DATA_VALUE.findall
         loops = LOOP.split(self.raw_data)[1:]
         for loop in loops:
-            data_names = DATA_NAME_START_LINE.findall(loop)
-            for data_name in data_names:
-                self.data_items[data_name] = []
+            data_names = [sys.intern(data_name)
+                          for data_name in DATA_NAME_START_LINE.findall(loop)]
             data_value_lines = loop.split("\n")[len(data_names):]
-            for line in data_value_lines:
-                data_values = DATA_VALUE.findall(line)
-                for data_name, data_value in zip(data_names, data_values):
-                    self.data_items[data_name].append(strip_quotes(data_value))
+            # split each row once, then gather the values column by column
+            rows = [find_data_values(line) for line in data_value_lines]
+            for column, data_name in enumerate(data_names):
+                self.data_items[data_name] = [strip_quotes(row[column])
+                                              for row in rows if column < len(row)]
 
     def __repr__(self) -> str:
         """Representation of DataBlock, abbreviating raw data"""
@@ -318,19 +406,33 @@ class CIFParser:
 
     def _strip_comments_and_blank_lines(self) -> None:
         """Remove all comments and blank lines raw file string."""
-        lines = self.raw_data.split("\n")
-        keep = [line for line in lines if not COMMENT_OR_BLANK.match(line)]
-        self.raw_data = "\n".join(keep)
+        # one pass over the whole string, removing each matching line
+        # along with its newline; COMMENT_OR_BLANK_LINE matches the
+        # same lines as COMMENT_OR_BLANK does line by line
+        self.raw_data = COMMENT_OR_BLANK_LINE.sub("", self.raw_data).rstrip("\n")
 
     def _extract_data_blocks(self) -> None:
         """Split raw file string into data blocks and save as a list
         of :class:`DataBlock` objects.
         """
-        self.data_blocks = []
-        data_blocks = DATA_BLOCK_HEADER.split(self.raw_data)[1:]
-        headers, blocks = data_blocks[::2], data_blocks[1::2]
-        for header, data in zip(headers, blocks):
-            self.data_blocks.append(DataBlock(header, data))
+        self.data_blocks = list(self._split_data_blocks())
+
+    def _split_data_blocks(self) -> Iterator[DataBlock]:
+        """Split raw file string into data blocks, yielding each one
+        as a :class:`DataBlock` object as soon as it is complete.
+        """
+        # a single scan over the lines, starting a new data block at
+        # each line beginning with "data_" (case-insensitive)
+        header, lines = None, []
+        for line in self.raw_data.split("\n"):
+            if line[:5].lower() == "data_":
+                if header is not None:
+                    yield DataBlock(header, "\n".join(lines).lstrip())
+                header, *lines = line.split(None, 1)
+            elif header is not None:
+                lines.append(line)
+        if header is not None:
+            yield DataBlock(header, "\n".join(lines).lstrip())
 
     def parse(self) -> None:
         """Parse the :term:`CIF` by :term:`data block` and extract
@@ -354,9 +456,32 @@ class CIFParser:
         self._strip_comments_and_blank_lines()
         self._extract_data_blocks()
         for data_block in self.data_blocks:
-            data_block.extract_data_items(SEMICOLON_DATA_ITEM)
+            data_block.extract_semicolon_data_items()
+            data_block.extract_data_items(INLINE_DATA_ITEM)
+            data_block.extract_loop_data_items()
+
+    def iter_data_blocks(self) -> Iterator[DataBlock]:
+        """Parse the :term:`CIF` lazily, one :term:`data block` at a
+        time.
+
+        Each data block is split off and has its :term:`data items`
+        extracted, in the same order as in `parse`, only when it is
+        requested. The data blocks are yielded rather than stored in
+        `data_blocks`, so a caller need only keep the data blocks it
+        is interested in and can stop once it has found them.
+
+        Examples
+        --------
+        >>> p = CIFParser("path/to/cif.cif")
+        >>> for data_block in p.iter_data_blocks():
+        ...     print(data_block.header)
+        """
+        self._strip_comments_and_blank_lines()
+        for data_block in self._split_data_blocks():
+            data_block.extract_semicolon_data_items()
             data_block.extract_data_items(INLINE_DATA_ITEM)
             data_block.extract_loop_data_items()
+            yield data_block
 
 
 class CIFParseError(Exception):
@@ -1,10 +1,12 @@
 import re
+import sys
+from types import MappingProxyType
 from typing import Dict, List, Union
 
 from .cif import load_cif
 
 # CIF data names corresponding to numerical parameters
-NUMERICAL_DATA_NAMES = (  # TODO: strip down to only data names used
+NUMERICAL_DATA_NAMES = frozenset(map(sys.intern, (  # TODO: strip down to only data names used
     "atom_site_fract_x",
     "atom_site_fract_y",
     "atom_site_fract_z",
@@ -17,9 +19,6 @@ NUMERICAL_DATA_NAMES = (  # TODO: strip down to only data names used
     "atom_site_aniso_U_23",
     "atom_site_aniso_U_33",
     "atom_site_attached_hydrogens",
-    "atom_site_fract_x",
-    "atom_site_fract_y",
-    "atom_site_fract_z",
     "atom_site_occupancy",
     "atom_site_symmetry_multiplicity",
     "atom_type_oxidation_number",
@@ -46,10 +45,10 @@ NUMERICAL_DATA_NAMES = (  # TODO: strip down to only data names used
     "refine_ls_wR_factor_gt",
     "symmetry_Int_Tables_number",
     "symmetry_equiv_pos_site_id",
-)
+)))
 
 # CIF data names corresponding to textual parameters
-TEXTUAL_DATA_NAMES = (
+TEXTUAL_DATA_NAMES = frozenset(map(sys.intern, (
     "atom_site_aniso_label",
     "atom_site_calc_flag",
     "atom_site_label",
@@ -84,10 +83,10 @@ TEXTUAL_DATA_NAMES = (
     "symmetry_equiv_pos_as_xyz",
     "symmetry_space_group_name_H-M",
     "symmetry_space_group_name_Hall"
-)
+)))
 
 # Map between diffraction object parameters and CIF data names
-CIF_NAMES = {
+CIF_NAMES = MappingProxyType({
     "a": "cell_length_a",
     "b": "cell_length_b",
     "c": "cell_length_c",
@@ -95,9 +94,9 @@ CIF_NAMES = {
     "beta": "cell_angle_beta",
     "gamma": "cell_angle_gamma",
     "space_group": "symmetry_space_group_name_H-M"
-}
+})
 
-NUMERICAL_DATA_VALUE = re.compile("(-?\d+\.?\d*)(?:\(\d+\))?$")
+NUMERICAL_DATA_VALUE = re.compile(r"(-?\d+\.?\d*)(?:\(\d+\))?$")
 
 
 def load_data_block(filepath: str, data_block: str = None):
@@ -112,7 +111,7 @@ def load_data_block(filepath: str, data_block: str = None):
     """
     cif = load_cif(filepath)
     if len(cif) == 1:
-        (_, data), = cif.items()
+        data = next(iter(cif.values()))
     else:
         if data_block is None:
             raise TypeError(
@@ -163,13 +162,22 @@ def cif_numerical(data_name: str,
     list is converted and the converted list is returned.
     """
     if isinstance(data_value, list):
-        data_value = [cif_numerical(data_name, data_value_element)
-                      for data_value_element in data_value]
+        # convert the whole list in one pass, only falling back to
+        # element-wise conversion to report an invalid data value
+        match = NUMERICAL_DATA_VALUE.match
+        try:
+            data_value = [float(match(data_value_element).group(1))
+                          for data_value_element in data_value]
+        except (AttributeError, TypeError, ValueError):
+            for data_value_element in data_value:
+                cif_numerical(data_name, data_value_element)
+            raise ValueError("Invalid numerical value in input "
+                             "CIF {0}: {1}".format(data_name, data_value))
     else:
         try:
             match = NUMERICAL_DATA_VALUE.match(data_value)
             data_value = float(match.group(1))
-        except (AttributeError, ValueError):
+        except (AttributeError, TypeError, ValueError):
             raise ValueError("Invalid numerical value in input "
                              "CIF {0}: {1}".format(data_name, data_value))
     return data_value
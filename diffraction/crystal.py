@@ -1,9 +1,10 @@
+import sys
 from typing import Any, Dict, Sequence
 
 import numpy as np
 
 from .cif.helpers import CIF_NAMES, get_cif_data, load_data_block
-from .lattice import DirectLattice
+from .lattice import DirectLattice, LATTICE_PARAMETER_CIF_NAMES
 
 LatticeParameters, Position = Sequence[float], Sequence[float]
 
@@ -59,6 +60,19 @@ class Site:
             self.position, other.position, atol=self.precision))
 
 
+def _sites_from_cif_data(data_items: Dict[str, Any]) -> Dict[str, Site]:
+    """Create the atomic sites declared in the :term:`data items` of a
+    :term:`CIF` :term:`data block`."""
+    atomic_site_data = get_cif_data(data_items,
+                                    "atom_site_label",
+                                    "atom_site_type_symbol",
+                                    "atom_site_fract_x",
+                                    "atom_site_fract_y",
+                                    "atom_site_fract_z")
+    return {label: Site(element, position)
+            for label, element, *position in zip(*atomic_site_data)}
+
+
 class Crystal:  # TODO: Finish docstring and update glossary. lattparams_rad?
     """Class to represent Crystal
 
@@ -113,6 +127,18 @@ class Crystal:  # TODO: Finish docstring and update glossary. lattparams_rad?
         self.space_group = space_group
         self.sites = {}
 
+    @property
+    def space_group(self) -> str:
+        return self._space_group
+
+    @space_group.setter
+    def space_group(self, new_space_group: str) -> None:
+        # the same few space groups recur across many crystals, so share
+        # a single copy of each string between them
+        if isinstance(new_space_group, str):
+            new_space_group = sys.intern(new_space_group)
+        self._space_group = new_space_group
+
     @classmethod
     def from_dict(cls, input_dict: Dict[str, float]) -> "Crystal":
         """Create a Crystal using a dictionary as input
@@ -193,21 +219,19 @@ class Crystal:  # TODO: Finish docstring and update glossary. lattparams_rad?
         >>> calcite.space_group
         'R -3 c H'
         """
-        crystal = cls.__new__(cls)
-        lattice = DirectLattice.from_cif(filepath, data_block)
+        # load the data block once and extract all parameters in one pass
         data_items = load_data_block(filepath, data_block)
-        [space_group] = get_cif_data(data_items, CIF_NAMES["space_group"])
-        crystal.lattice, crystal.space_group = lattice, space_group
+        *lattice_parameters, space_group = get_cif_data(
+            data_items, *LATTICE_PARAMETER_CIF_NAMES, CIF_NAMES["space_group"])
+        crystal = cls(lattice_parameters, space_group)
         if load_sites:
-            crystal.sites = {}
-            crystal.add_sites_from_cif(filepath, data_block)
+            crystal.sites.update(_sites_from_cif_data(data_items))
         return crystal
 
     def __repr__(self) -> str:
-        repr_string = ("{0}([{1.a!r}, {1.b!r}, {1.c!r}, "
-                       "{1.alpha!r}, {1.beta!r}, {1.gamma!r}], "
-                       "{1.space_group!r})")
-        return repr_string.format(self.__class__.__name__, self)
+        return (f"{type(self).__name__}([{self.a!r}, {self.b!r}, {self.c!r}, "
+                f"{self.alpha!r}, {self.beta!r}, {self.gamma!r}], "
+                f"{self.space_group!r})")
 
     def __getattr__(self, name: str) -> Any:  # TODO: Only delegate access for certain variables
         return getattr(self.lattice, name)
@@ -217,14 +241,7 @@ class Crystal:  # TODO: Finish docstring and update glossary. lattparams_rad?
                            data_block: str = None
                            ) -> None:
         data_items = load_data_block(filepath, data_block)
-        atomic_site_data = get_cif_data(data_items,
-                                        "atom_site_label",
-                                        "atom_site_type_symbol",
-                                        "atom_site_fract_x",
-                                        "atom_site_fract_y",
-                                        "atom_site_fract_z")
-        for label, element, *position in zip(*atomic_site_data):
-            self.sites[label] = Site(element, position)
+        self.sites.update(_sites_from_cif_data(data_items))
 
     def add_sites(self, atoms: Dict[str, Position]) -> None:  # TODO: Finish docstring
         """Add atomic site to crystal
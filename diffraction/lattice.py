@@ -52,8 +52,8 @@ Lattice vector calculations can be done in both direct space...
 >>> u.norm()
 4.99
 >>> v = calcite_lattice.vector([0, 0, 1])
->>> u + v
-DirectLatticeVector([ 1, 0,  1])
+>>> print(u + v)
+DirectLatticeVector([1, 0, 1])
 >>> u.inner(v)
 0.0
 
@@ -75,9 +75,10 @@ DirectLatticeVector([ 1, 0,  1])
 """
 
 import abc
-from functools import wraps
+from functools import lru_cache, wraps
 import math
-from typing import Callable, Dict, Optional, Sequence, Tuple, Union
+import numbers
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
@@ -88,6 +89,18 @@ LatticeParameters = Sequence[float]
 __all__ = ["DirectLattice", "DirectLatticeVector", "ReciprocalLattice",
            "ReciprocalLatticeVector"]
 
+LATTICE_PARAMETER_KEYS = ("a", "b", "c", "alpha", "beta", "gamma")
+# CIF data names of the lattice parameters, in the same order as above
+LATTICE_PARAMETER_CIF_NAMES = tuple(CIF_NAMES[key]
+                                    for key in LATTICE_PARAMETER_KEYS)
+
+# the same factors math.radians and math.degrees multiply by
+_DEG2RAD = math.pi / 180.0
+_RAD2DEG = 180.0 / math.pi
+# scale between direct and reciprocal space in the physics convention
+_TWO_PI = 2.0 * math.pi
+_TWO_PI_SQUARED = _TWO_PI * _TWO_PI
+
 
 def _to_radians(lattice_parameters: LatticeParameters) -> LatticeParameters:
     """Convert angles in :term:`lattice parameters` from degrees to
@@ -104,10 +117,8 @@ def _to_radians(lattice_parameters: LatticeParameters) -> LatticeParameters:
         The :term:`lattice parameters` with angles in units of radians.
     """
 
-    lengths = tuple(lattice_parameters)[:3]
-    angles_in_radians = tuple(math.radians(angle)
-                              for angle in tuple(lattice_parameters)[3:])
-    return lengths + angles_in_radians
+    a, b, c, alpha, beta, gamma = lattice_parameters
+    return a, b, c, alpha * _DEG2RAD, beta * _DEG2RAD, gamma * _DEG2RAD
 
 
 def _to_degrees(lattice_parameters: LatticeParameters) -> LatticeParameters:
@@ -125,10 +136,8 @@ def _to_degrees(lattice_parameters: LatticeParameters) -> LatticeParameters:
         The lattice parameters with angles in units of degrees.
     """
 
-    lengths = tuple(lattice_parameters)[:3]
-    angles_in_degrees = tuple(math.degrees(angle)
-                              for angle in tuple(lattice_parameters)[3:])
-    return lengths + angles_in_degrees
+    a, b, c, alpha, beta, gamma = lattice_parameters
+    return a, b, c, alpha * _RAD2DEG, beta * _RAD2DEG, gamma * _RAD2DEG
 
 
 def metric_tensor(lattice_parameters: LatticeParameters) -> np.ndarray:
@@ -145,14 +154,36 @@ def metric_tensor(lattice_parameters: LatticeParameters) -> np.ndarray:
     ndarray:
         The metric tensor of the lattice.
     """
-    a, b, c, al, be, ga = _to_radians(lattice_parameters)
-    tensor = np.around([[a ** 2, a * b * np.cos(ga), a * c * math.cos(be)],
-                        [a * b * math.cos(ga), b ** 2, b * c * math.cos(al)],
-                        [a * c * math.cos(be), b * c * np.cos(al), c ** 2]],
-                       10)
+    a, b, c, al, be, ga = lattice_parameters
+    # fill the symmetric tensor directly rather than converting from a
+    # nested list, which dominates the cost for a 3x3 array
+    tensor = np.empty((3, 3))
+    tensor[0, 0] = a * a
+    tensor[1, 1] = b * b
+    tensor[2, 2] = c * c
+    tensor[0, 1] = tensor[1, 0] = a * b * _cos_degrees(ga)
+    tensor[0, 2] = tensor[2, 0] = a * c * _cos_degrees(be)
+    tensor[1, 2] = tensor[2, 1] = b * c * _cos_degrees(al)
     return tensor
 
 
+def _cos_degrees(angle: float) -> float:
+    """Calculate the cosine of an angle in degrees, giving exactly zero
+    for right angles so that orthogonal axes have zero metric terms."""
+    if angle == 90:
+        return 0.0
+    return math.cos(angle * _DEG2RAD)
+
+
+def _cell_volume(a: float, b: float, c: float,
+                 al: float, be: float, ga: float) -> float:
+    """Calculate the volume of the unit cell with the given lattice
+    parameters, with the angles in units of radians."""
+    ca, cb, cg = math.cos(al), math.cos(be), math.cos(ga)
+    return a * b * c * math.sqrt(
+        1.0 - ca * ca - cb * cb - cg * cg + 2.0 * ca * cb * cg)
+
+
 def reciprocalise(lattice_parameters: LatticeParameters) -> LatticeParameters:
     """Transform the lattice parameters to those of the reciprocally
     related lattice.
@@ -173,16 +204,28 @@ def reciprocalise(lattice_parameters: LatticeParameters) -> LatticeParameters:
         The lattice parameters of the lattice reciprocally related to
         the input lattice, with the angles in units of degrees.
     """
-    a, b, c, al, be, ga = _to_radians(lattice_parameters)
-    cell_volume = np.sqrt(np.linalg.det(metric_tensor(lattice_parameters)))
-    pi, sin, cos, arccos = math.pi, math.sin, math.cos, math.acos
+    return _reciprocalise(tuple(lattice_parameters))
 
-    a_ = 2 * pi * b * c * sin(al) / cell_volume
-    b_ = 2 * pi * a * c * sin(be) / cell_volume
-    c_ = 2 * pi * a * b * sin(ga) / cell_volume
-    alpha_ = arccos((cos(be) * cos(ga) - cos(al)) / (sin(be) * sin(ga)))
-    beta_ = arccos((cos(al) * cos(ga) - cos(be)) / (sin(al) * sin(ga)))
-    gamma_ = arccos((cos(al) * cos(be) - cos(ga)) / (sin(al) * sin(be)))
+
+@lru_cache(maxsize=1024)
+def _reciprocalise(lattice_parameters: Tuple[float, ...]) -> LatticeParameters:
+    """Cached implementation of reciprocalise, as equivalent lattices
+    are frequently transformed many times over."""
+    a, b, c, al, be, ga = _to_radians(lattice_parameters)
+    sin, cos, arccos = math.sin, math.cos, math.acos
+    ca, cb, cg = cos(al), cos(be), cos(ga)
+    sa, sb, sg = sin(al), sin(be), sin(ga)
+    # same closed form as _cell_volume, reusing the cosines
+    cell_volume = a * b * c * math.sqrt(
+        1.0 - ca * ca - cb * cb - cg * cg + 2.0 * ca * cb * cg)
+    two_pi_over_volume = _TWO_PI / cell_volume
+
+    a_ = b * c * sa * two_pi_over_volume
+    b_ = a * c * sb * two_pi_over_volume
+    c_ = a * b * sg * two_pi_over_volume
+    alpha_ = arccos((cb * cg - ca) / (sb * sg))
+    beta_ = arccos((ca * cg - cb) / (sa * sg))
+    gamma_ = arccos((ca * cb - cg) / (sa * sb))
 
     return _to_degrees((a_, b_, c_, alpha_, beta_, gamma_))
 
@@ -210,19 +253,72 @@ class Lattice(abc.ABC):
         with angles in degrees.
     metric: ndarray
         The :term:`metric tensor` of the direct basis.
+    inverse_metric: ndarray
+        The inverse of the :term:`metric tensor`.
     unit_cell_volume: float
         The volume of the :term:`unit cell`
 
+    Methods
+    -------
+    norms:
+        Calculate the norms of an array of vectors in the lattice.
+    inner_batch:
+        Calculate the inner products of two arrays of vectors in the
+        lattice.
+    angles:
+        Calculate the angles between two arrays of vectors in the
+        lattice.
+
     Class Attributes
     ----------------
     lattice_parameter_keys: tuple
+
+    Notes
+    -----
+    The metric tensor, its inverse and the unit cell volume are computed
+    on first access and cached, as is the reciprocally related lattice.
+    The cache is discarded whenever any of the lattice parameters is
+    changed.
+
+    Lattices of the same type compare equal, and hash equally, when
+    their lattice parameters are equal. Changing a lattice parameter
+    therefore changes the hash, so lattices used as dictionary keys
+    should not be modified.
     """
+    __slots__ = ("_metric", "_inverse_metric", "_unit_cell_volume",
+                 "_reciprocal")
     lattice_parameter_keys = None  # type: Tuple[str, str, str, str, str, str]
 
     def __init__(self, lattice_parameters: LatticeParameters):
+        # the lattice reciprocally related to this one, once created
+        self._reciprocal = None
         lattice_parameters = self.check_lattice_parameters(lattice_parameters)
+        # bypass the cache invalidation in __setattr__ and clear it once
         for key, value in zip(self.lattice_parameter_keys, lattice_parameters):
-            setattr(self, key, value)
+            object.__setattr__(self, key, value)
+        self._clear_cache()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self.lattice_parameter_keys:
+            self._clear_cache()
+
+    def __reduce__(self):
+        # rebuild from the lattice parameters rather than restoring the
+        # slots one by one, which would trigger cache invalidation on a
+        # partially initialised lattice
+        return type(self), (self.lattice_parameters,)
+
+    def _clear_cache(self) -> None:
+        """Discard the cached properties derived from the lattice
+        parameters."""
+        self._metric = None
+        self._inverse_metric = None
+        self._unit_cell_volume = None
+        # the linked lattice is no longer reciprocal to this one
+        if self._reciprocal is not None:
+            self._reciprocal._reciprocal = None
+            self._reciprocal = None
 
     def check_lattice_parameters(self, lattice_parameters: LatticeParameters
                                  ) -> LatticeParameters:
@@ -243,14 +339,23 @@ class Lattice(abc.ABC):
         """
         if len(lattice_parameters) < 6:
             raise (ValueError("Missing lattice parameter from input"))
-        lattice_parameters_ = []
+        try:
+            # convert in a single pass for the common all-numeric input;
+            # float() hands floats back unchanged, so this replaces the
+            # earlier per-value skip of parameters that were already floats
+            return list(map(float, lattice_parameters))[:6]
+        except (TypeError, ValueError):
+            pass
+        # find the offending parameter to report
         for key, value in zip(self.lattice_parameter_keys, lattice_parameters):
             try:
-                lattice_parameters_.append(float(value))
-            except ValueError:
+                float(value)
+            except (TypeError, ValueError):
                 raise ValueError("Invalid lattice parameter {0}: {1}".format(
                     key, value))
-        return lattice_parameters_
+        # an invalid value after the six lattice parameters is ignored
+        return [float(value) for _, value in
+                zip(self.lattice_parameter_keys, lattice_parameters)]
 
     @classmethod
     @abc.abstractmethod
@@ -270,14 +375,14 @@ class Lattice(abc.ABC):
             If the input dict is missing any :term:`lattice parameters`
         """
 
-        lattice_parameters = []
-        for parameter in cls.lattice_parameter_keys:
-            try:
-                lattice_parameters.append(input_dict[parameter])
-            except KeyError:  # TODO: Is OK that reports just 1st missing para?
-                raise ValueError("Parameter: '{0}' missing from input "
-                                 "dictionary".format(parameter))
-        return cls(lattice_parameters)
+        missing_parameters = [parameter for parameter in cls.lattice_parameter_keys
+                              if parameter not in input_dict]
+        if missing_parameters:
+            raise ValueError("Parameter{0}: {1} missing from input dictionary".format(
+                "s" if len(missing_parameters) > 1 else "",
+                ", ".join("'{0}'".format(parameter) for parameter in missing_parameters)))
+        return cls([input_dict[parameter]
+                    for parameter in cls.lattice_parameter_keys])
 
     @property
     def lattice_parameters(self) -> LatticeParameters:
@@ -286,22 +391,106 @@ class Lattice(abc.ABC):
 
     @property
     def metric(self) -> np.ndarray:
-        return metric_tensor(self.lattice_parameters)
+        if self._metric is None:
+            self._metric = metric_tensor(self.lattice_parameters)
+            # the cached tensor is shared so must not be modified in place
+            self._metric.setflags(write=False)
+        return self._metric
+
+    @property
+    def inverse_metric(self) -> np.ndarray:
+        if self._inverse_metric is None:
+            self._inverse_metric = np.linalg.inv(self.metric)
+            self._inverse_metric.setflags(write=False)
+        return self._inverse_metric
 
     @property
     def unit_cell_volume(self) -> float:
-        return np.sqrt(np.linalg.det(self.metric))
+        if self._unit_cell_volume is None:
+            self._unit_cell_volume = _cell_volume(
+                *_to_radians(self.lattice_parameters))
+        return self._unit_cell_volume
+
+    def norms(self, vectors: np.ndarray) -> np.ndarray:
+        """Calculate the norms of many vectors in the lattice at once.
+
+        Parameters
+        ----------
+        vectors: array_like
+            An (N, 3) array of vector components in the basis of the
+            lattice.
+
+        Returns
+        -------
+        ndarray:
+            The N norms of the vectors.
+        """
+        return np.sqrt(self.inner_batch(vectors, vectors))
+
+    def inner_batch(self,
+                    vectors_1: np.ndarray,
+                    vectors_2: np.ndarray
+                    ) -> np.ndarray:
+        """Calculate the inner products of pairs of vectors in the
+        lattice at once.
+
+        Parameters
+        ----------
+        vectors_1, vectors_2: array_like
+            (N, 3) arrays of vector components in the basis of the
+            lattice.
+
+        Returns
+        -------
+        ndarray:
+            The N inner products of corresponding rows of the two
+            arrays.
+        """
+        # a BLAS matrix product followed by a row-wise dot product is
+        # several times faster than a three operand einsum for large N
+        return np.einsum("ij,ij->i", np.asarray(vectors_1) @ self.metric,
+                         vectors_2)
+
+    def angles(self,
+               vectors_1: np.ndarray,
+               vectors_2: np.ndarray
+               ) -> np.ndarray:
+        """Calculate the angles between pairs of vectors in the lattice
+        at once.
+
+        Parameters
+        ----------
+        vectors_1, vectors_2: array_like
+            (N, 3) arrays of vector components in the basis of the
+            lattice.
+
+        Returns
+        -------
+        ndarray:
+            The N angles, in degrees, between corresponding rows of the
+            two arrays.
+        """
+        cos_angles = self.inner_batch(vectors_1, vectors_2)
+        cos_angles /= self.norms(vectors_1)
+        cos_angles /= self.norms(vectors_2)
+        np.clip(cos_angles, -1.0, 1.0, out=cos_angles)
+        return np.degrees(np.arccos(cos_angles, out=cos_angles), out=cos_angles)
+
+    def __eq__(self, other: "Lattice") -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.lattice_parameters == other.lattice_parameters
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.lattice_parameters))
 
     def __repr__(self) -> str:
-        repr_string = ("{0}([{1!r}, {2!r}, {3!r}, "
-                       "{4!r}, {5!r}, {6!r}])")
-        rounded_lattice_parameters = [round(parameter, 4) for parameter
-                                      in self.lattice_parameters]
-        return repr_string.format(self.__class__.__name__,
-                                  *rounded_lattice_parameters)
+        a, b, c, alpha, beta, gamma = [round(parameter, 4) for parameter
+                                       in self.lattice_parameters]
+        return (f"{type(self).__name__}([{a!r}, {b!r}, {c!r}, "
+                f"{alpha!r}, {beta!r}, {gamma!r}])")
 
-    def __str__(self) -> str:
-        return repr(self)
+    __str__ = __repr__
 
 
 class DirectLattice(Lattice):
@@ -361,7 +550,8 @@ class DirectLattice(Lattice):
            [-12.45005 ,  24.9001  ,   0.      ],
            [  0.      ,   0.      , 289.068004]])
     """
-    lattice_parameter_keys = ("a", "b", "c", "alpha", "beta", "gamma")
+    lattice_parameter_keys = LATTICE_PARAMETER_KEYS
+    __slots__ = lattice_parameter_keys
 
     @classmethod
     def from_cif(cls,
@@ -393,16 +583,26 @@ class DirectLattice(Lattice):
         """
 
         data_items = load_data_block(filepath, data_block)
-        data_names = [CIF_NAMES[key] for key in cls.lattice_parameter_keys]
-        lattice_parameters = get_cif_data(data_items, *data_names)
+        lattice_parameters = get_cif_data(data_items,
+                                          *LATTICE_PARAMETER_CIF_NAMES)
         return cls(lattice_parameters)
 
+    @property
+    def lattice_parameters(self) -> LatticeParameters:
+        # spelt out as this is read every time a derived property is
+        # computed
+        return self.a, self.b, self.c, self.alpha, self.beta, self.gamma
+
     def vector(self, uvw: Sequence[float]) -> "DirectLatticeVector":
         return DirectLatticeVector(uvw, self)
 
     def reciprocal(self) -> "ReciprocalLattice":
-        reciprocal_lattice_parameters = reciprocalise(self.lattice_parameters)
-        return ReciprocalLattice(reciprocal_lattice_parameters)
+        """Return the corresponding reciprocal lattice object."""
+        if self._reciprocal is None:
+            reciprocal_lattice_parameters = reciprocalise(self.lattice_parameters)
+            self._reciprocal = ReciprocalLattice(reciprocal_lattice_parameters)
+            self._reciprocal._reciprocal = self
+        return self._reciprocal
 
 
 class ReciprocalLattice(Lattice):
@@ -431,6 +631,7 @@ class ReciprocalLattice(Lattice):
     """
     lattice_parameter_keys = ("a_star", "b_star", "c_star",
                               "alpha_star", "beta_star", "gamma_star")
+    __slots__ = lattice_parameter_keys
 
     @classmethod
     def from_cif(cls,
@@ -462,12 +663,16 @@ class ReciprocalLattice(Lattice):
         """
 
         data_items = load_data_block(filepath, data_block)
-        data_names = [CIF_NAMES[key] for key in
-                      "a b c alpha beta gamma".split()]
-        lattice_parameters = get_cif_data(data_items, *data_names)
+        lattice_parameters = get_cif_data(data_items,
+                                          *LATTICE_PARAMETER_CIF_NAMES)
         reciprocal_lps = reciprocalise(lattice_parameters)
         return cls(reciprocal_lps)
 
+    @property
+    def lattice_parameters(self) -> LatticeParameters:
+        return (self.a_star, self.b_star, self.c_star,
+                self.alpha_star, self.beta_star, self.gamma_star)
+
     def vector(self, hkl: Sequence[float]) -> "ReciprocalLatticeVector":
         """Return a reciprocal lattice vector defined on this
         reciprocal lattice.
@@ -488,14 +693,54 @@ class ReciprocalLattice(Lattice):
 
     def direct(self) -> "DirectLattice":
         """Return the corresponding direct lattice object."""
-        direct_lattice_parameters = reciprocalise(self.lattice_parameters)
-        return DirectLattice(direct_lattice_parameters)
+        if self._reciprocal is None:
+            direct_lattice_parameters = reciprocalise(self.lattice_parameters)
+            self._reciprocal = DirectLattice(direct_lattice_parameters)
+            self._reciprocal._reciprocal = self
+        return self._reciprocal
+
+
+if hasattr(math, "fma"):  # Python 3.13+
+    def _matrix_vector_product(matrix: Sequence[Sequence[float]],
+                               v: Sequence[float]) -> Tuple[float, float, float]:
+        """Evaluate M.v with a single rounding per multiply-add."""
+        fma = math.fma
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = matrix
+        v0, v1, v2 = v
+        if m01 == m02 == m12 == 0.0:  # right-angled unit cell
+            return m00 * v0, m11 * v1, m22 * v2
+        return (fma(m02, v2, fma(m01, v1, m00 * v0)),
+                fma(m12, v2, fma(m11, v1, m10 * v0)),
+                fma(m22, v2, fma(m21, v1, m20 * v0)))
+
+    def _dot(u: Sequence[float], v: Sequence[float]) -> float:
+        """Evaluate u.v with a single rounding per multiply-add."""
+        u0, u1, u2 = u
+        v0, v1, v2 = v
+        return math.fma(u2, v2, math.fma(u1, v1, u0 * v0))
+else:
+    def _matrix_vector_product(matrix: Sequence[Sequence[float]],
+                               v: Sequence[float]) -> Tuple[float, float, float]:
+        """Evaluate M.v."""
+        (m00, m01, m02), (m10, m11, m12), (m20, m21, m22) = matrix
+        v0, v1, v2 = v
+        if m01 == m02 == m12 == 0.0:  # right-angled unit cell
+            return m00 * v0, m11 * v1, m22 * v2
+        return (m00 * v0 + m01 * v1 + m02 * v2,
+                m10 * v0 + m11 * v1 + m12 * v2,
+                m20 * v0 + m21 * v1 + m22 * v2)
+
+    def _dot(u: Sequence[float], v: Sequence[float]) -> float:
+        """Evaluate u.v."""
+        u0, u1, u2 = u
+        v0, v1, v2 = v
+        return u0 * v0 + u1 * v1 + u2 * v2
 
 
 def check_lattice(operation: Callable) -> Callable:
     @wraps(operation)  # TODO: sort error msg when adding direct + recip vector
     def wrapper(self, other):
-        if self.lattice != other.lattice:
+        if self.lattice is not other.lattice and self.lattice != other.lattice:
             raise TypeError("lattice must be the same for both "
                             "{0}s".format(self.__class__.__name__))
         else:
@@ -504,7 +749,7 @@ def check_lattice(operation: Callable) -> Callable:
     return wrapper
 
 
-class DirectLatticeVector(np.ndarray):
+class DirectLatticeVector:
     """Class to represent a direct lattice vector
 
     Parameters
@@ -516,6 +761,8 @@ class DirectLatticeVector(np.ndarray):
 
     Attributes
     ----------
+    components: tuple
+        The u, v, w components of the direct lattice vector.
     lattice: DirectLattice
         The direct lattice the vector is associated with.
 
@@ -530,40 +777,72 @@ class DirectLatticeVector(np.ndarray):
         Calculate the angle between the vector and another direct
         lattice vector.
 
+    Notes
+    -----
+    Lattice vectors only ever have three components, so they are held
+    as a tuple of plain numbers rather than as an ndarray, for which the
+    per-operation overhead far exceeds the arithmetic. Use
+    ``np.asarray(vector)`` where array semantics are needed.
     """  # TODO: finish docstring
-    # TODO: implement __repr__ + tests
+    __slots__ = ("components", "lattice", "_metric_product")
 
-    def __new__(cls,
-                uvw: Sequence,
-                lattice: DirectLattice
-                ) -> "DirectLatticeVector":
-        vector = np.asarray(uvw).view(cls)
-        vector.lattice = lattice
-        return vector
-
-    def __array_finalize__(self, vector: "DirectLatticeVector"):
-        self.lattice = getattr(vector, "lattice", None)
+    def __init__(self, uvw: Sequence[float], lattice: DirectLattice):
+        if isinstance(uvw, np.ndarray):
+            uvw = uvw.tolist()
+        self.components = tuple(uvw)
+        self.lattice = lattice
+        # the metric and components the cached product was computed
+        # with, and M.v
+        self._metric_product = None
 
     def __eq__(self, other: "DirectLatticeVector") -> bool:
-        return np.array_equal(self, other) and self.lattice == other.lattice
+        if not isinstance(other, DirectLatticeVector):
+            return NotImplemented
+        return (self.components == other.components and
+                (self.lattice is other.lattice or self.lattice == other.lattice))
 
-    def __ne__(self, other: "DirectLatticeVector") -> bool:
-        return not self == other
+    def __hash__(self) -> int:
+        return hash((self.components, self.lattice))
 
     @check_lattice
     def __add__(self, other: "DirectLatticeVector") -> "DirectLatticeVector":
-        return np.ndarray.__add__(self, other)
+        return type(self)([x + y for x, y in zip(self.components, other.components)],
+                          self.lattice)
 
     @check_lattice
     def __sub__(self, other: "DirectLatticeVector") -> "DirectLatticeVector":
-        return np.ndarray.__sub__(self, other)
+        return type(self)([x - y for x, y in zip(self.components, other.components)],
+                          self.lattice)
+
+    def __mul__(self, scalar: float) -> "DirectLatticeVector":
+        if not isinstance(scalar, numbers.Real):
+            return NotImplemented
+        return type(self)([scalar * x for x in self.components], self.lattice)
+
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "DirectLatticeVector":
+        return type(self)([-x for x in self.components], self.lattice)
+
+    def __len__(self) -> int:
+        return len(self.components)
+
+    def __iter__(self):
+        return iter(self.components)
+
+    def __getitem__(self, index):
+        return self.components[index]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self.components, dtype=dtype)
 
     def __repr__(self) -> str:
         return "{0}({1}, {2})".format(
-            self.__class__.__name__, list(self), self.lattice)
+            self.__class__.__name__, list(self.components), self.lattice)
 
     def __str__(self) -> str:
-        return "{0}({1})".format(self.__class__.__name__, list(self))
+        return "{0}({1})".format(self.__class__.__name__,
+                                 list(self.components))
 
     def norm(self) -> float:
         """Calculate the norm (or magnitude) of the vector
@@ -574,7 +853,7 @@ class DirectLatticeVector(np.ndarray):
             The norm of the vector.
         """
 
-        return np.sqrt(self.dot(self.lattice.metric).dot(self))
+        return math.sqrt(_dot(self.components, self._metric_dot()))
 
     def inner(self, other: "DirectLatticeVector") -> float:
         """Calculate the inner product between the vector and another direct
@@ -591,24 +870,48 @@ class DirectLatticeVector(np.ndarray):
         """
         #  TODO: is there any way to do this apart from type-checking?
         if type(other) is ReciprocalLatticeVector:
-            if not np.allclose(
+            # lattices linked by reciprocal() or direct() are known to be
+            # related so only compare metrics for independently made ones
+            if other.lattice is not self.lattice._reciprocal and not np.allclose(
                     self.lattice.metric,
-                    np.linalg.inv(other.lattice.metric / (2 * np.pi) ** 2),
+                    other.lattice.inverse_metric * _TWO_PI_SQUARED,
                     rtol=1e-2):
                 raise TypeError("{0} and {1} lattices must be reciprocally "
                                 "related.".format(self.__class__.__name__,
                                                   other.__class__.__name__))
-            return 2 * np.pi * self.dot(other)
+            return _TWO_PI * _dot(self.components, other.components)
 
-        if self.lattice != other.lattice:
+        if self.lattice is not other.lattice and self.lattice != other.lattice:
             raise TypeError("lattice must be the same for both "
                             "{0}s".format(self.__class__.__name__))
 
-        return self.dot(self.lattice.metric).dot(other)
+        return _dot(other.components, self._metric_dot())
+
+    def _metric_dot(self) -> Tuple[float, float, float]:
+        """Return the product of the lattice metric with the vector,
+        which is cached as it is shared by every norm and inner product
+        of the vector."""
+        metric, components = self.lattice.metric, self.components
+        # the lattice replaces its metric when its parameters change and
+        # reassigning the components replaces the tuple, so either one
+        # being a different object means the product must be recomputed
+        cached = self._metric_product
+        if cached is None or cached[0] is not metric or cached[1] is not components:
+            cached = self._metric_product = (
+                metric, components, _matrix_vector_product(metric.tolist(), components))
+        return cached[2]
 
     def angle(self, other: "DirectLatticeVector") -> float:
         u, v = self, other
-        return math.degrees(math.acos(u.inner(v) / (u.norm() * v.norm())))
+        inner_product = u.inner(v)
+        norms = u.norm() * v.norm()
+        # the angle to a zero vector is undefined
+        if norms == 0:
+            return math.nan
+        cos_angle = inner_product / norms
+        # rounding can push the cosine of (anti)parallel vectors just
+        # outside the domain of acos
+        return math.degrees(math.acos(min(1.0, max(-1.0, cos_angle))))
 
 
 class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
@@ -623,6 +926,8 @@ class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
 
     Attributes
     ----------
+    components: tuple
+        The h, k, l components of the reciprocal lattice vector.
     lattice: ReciprocalLattice
         The reciprocal lattice the vector is associated with.
 
@@ -638,14 +943,10 @@ class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
         lattice vector.
 
     """
+    __slots__ = ()
 
-    def __new__(cls,
-                hkl: Sequence[float],
-                lattice: ReciprocalLattice
-                ) -> "ReciprocalLatticeVector":
-        vector = np.asarray(hkl).view(cls)
-        vector.lattice = lattice
-        return vector
+    def __init__(self, hkl: Sequence[float], lattice: ReciprocalLattice):
+        super().__init__(hkl, lattice)
 
     # TODO: add copies of functions so docstrings aren't inherited using super
 
@@ -666,16 +967,18 @@ class ReciprocalLatticeVector(DirectLatticeVector):  # TODO: Finish docstrings
         """
         #  TODO: is there any way to do this apart from type-checking?
         if type(other) is DirectLatticeVector:
-            if not np.allclose(
+            # lattices linked by reciprocal() or direct() are known to be
+            # related so only compare metrics for independently made ones
+            if other.lattice is not self.lattice._reciprocal and not np.allclose(
                     self.lattice.metric,
-                    np.linalg.inv(other.lattice.metric) * (2 * np.pi) ** 2,
+                    other.lattice.inverse_metric * _TWO_PI_SQUARED,
                     rtol=1e-2):
                 raise TypeError("{0} and {1} lattices must be reciprocally "
                                 "related.".format(self.__class__.__name__,
                                                   other.__class__.__name__))
-            return 2 * np.pi * self.dot(other)
+            return _TWO_PI * _dot(self.components, other.components)
 
-        if self.lattice != other.lattice:
+        if self.lattice is not other.lattice and self.lattice != other.lattice:
             raise TypeError("lattice must be the same for both "
                             "{0}s".format(self.__class__.__name__))
-        return self.dot(self.lattice.metric).dot(other)
+        return _dot(other.components, self._metric_dot())
@@ -1,11 +1,18 @@
+import copy
+from functools import lru_cache
 import json
-import pkg_resources
+import os
 from typing import Dict, List, Tuple, Union
 
+import numpy as np
+
 __all__ = ["PointGroup"]
 
 Matrix = List[List[int]]
 
+POINT_GROUP_DATA_DIRECTORY = os.path.join(os.path.dirname(__file__),
+                                          "static", "point_groups")
+
 POINT_GROUP_NUMBERS = {
     '1': 1, '-1': 2, '2': 3, 'm': 4, '2/m': 5, '222': 6, 'mm2': 7, 'mmm': 8,
     '4': 9, '-4': 10, '4/m': 11, '422': 12, '4mm': 13, '-42': 14, '4/mmm': 15,
@@ -40,6 +47,14 @@ class PointGroup:  # TODO: write a better docstring
         symmetry operators in the point group. The x,y,z and
         international representations are stored as strings and the
         matrix representation is stored as a 3x3 list.
+    matrices: ndarray
+        The matrix representations of the symmetry operators as a
+        read-only (N, 3, 3) array of 8-bit integers.
+
+    Methods
+    -------
+    apply:
+        Apply all the symmetry operators of the point group to a vector.
 
     Examples
     --------
@@ -52,6 +67,7 @@ class PointGroup:  # TODO: write a better docstring
     >>> point_group.operators["ita"][4]
     '4- 0,0,z'
     """
+    __slots__ = ("symbol", "number", "operators", "matrices")
 
     def __init__(self, symbol: str = None, number: int = None):
         if symbol is None and number is None:
@@ -59,6 +75,7 @@ class PointGroup:  # TODO: write a better docstring
                              "number must be given.")
         self.symbol, self.number, self.operators = \
             self._load_point_group_data(symbol, number)
+        self.matrices = _point_group_matrices(self.number)
 
     @staticmethod
     def _load_point_group_data(
@@ -69,14 +86,51 @@ class PointGroup:  # TODO: write a better docstring
         if symbol is not None:
             number = POINT_GROUP_NUMBERS[symbol]
 
-        json_string = pkg_resources.resource_string(
-            __name__, "static/point_groups/{}.json".format(number))
-        point_group_data = json.loads(json_string)
+        point_group_data = _read_point_group_file(number)
 
+        # each instance gets its own copy of the cached operators, so
+        # modifying them cannot affect other instances
         symbol, number, operators = (point_group_data["symbol"],
                                      point_group_data["number"],
-                                     point_group_data["operators"])
+                                     copy.deepcopy(point_group_data["operators"]))
         return symbol, number, operators
 
+    def apply(self, vector: List[float]) -> np.ndarray:
+        """Apply every symmetry operator of the point group to a vector.
+
+        Parameters
+        ----------
+        vector: array_like
+            The components of the vector.
+
+        Returns
+        -------
+        ndarray:
+            An (N, 3) array of the vectors produced by each of the N
+            symmetry operators, in the same order as the operators.
+        """
+        return self.matrices @ np.asarray(vector, dtype=float)
+
     def __repr__(self) -> str:
         return "{0}(\"{1}\")".format(self.__class__.__name__, self.symbol)
+
+
+@lru_cache(maxsize=None)
+def _read_point_group_file(number: int) -> Dict:
+    """Read and parse the data file of a point group, caching the
+    result so each of the 32 files is only parsed once."""
+    filepath = os.path.join(POINT_GROUP_DATA_DIRECTORY, "{}.json".format(number))
+    with open(filepath, "r") as json_file:
+        json_string = json_file.read()
+    return json.loads(json_string)
+
+
+@lru_cache(maxsize=None)
+def _point_group_matrices(number: int) -> np.ndarray:
+    """Stack the matrix representations of the symmetry operators of a
+    point group into a single array, shared between instances."""
+    # all point group matrix elements are -1, 0 or 1
+    matrices = np.array(
+        _read_point_group_file(number)["operators"]["matrix"], dtype=np.int8)
+    matrices.setflags(write=False)
+    return matrices
@@ -0,0 +1,14 @@
+import pytest
+
+from diffraction import ReciprocalLattice
+
+
+@pytest.fixture(scope="session")
+def calcite_cif_lattice():
+    return ReciprocalLattice.from_cif("tests/functional/static/valid_cifs/calcite_icsd.cif")
+
+
+@pytest.fixture(scope="session")
+def multi_block_cif_lattice():
+    return ReciprocalLattice.from_cif("tests/functional/static/valid_cifs/multi_data_block.cif",
+                                      data_block="data_CSD_CIF_ACAKOF")
@@ -1,5 +1,8 @@
-from numpy import array, pi, sqrt
-from numpy.testing import assert_array_almost_equal, assert_almost_equal
+import math
+import re
+
+from numpy import allclose, array, pi
+from numpy.testing import assert_almost_equal
 import pytest
 
 from diffraction import (DirectLattice, DirectLatticeVector,
@@ -8,30 +11,49 @@ from diffraction import (DirectLattice, DirectLatticeVector,
 CALCITE_RECIPROCAL_LATTICE_PARAMETERS = (1.4539, 1.4539, 0.3696, 90, 90, 60)
 CALCITE_RECIPROCAL_METRIC = array([[2.1138, 1.0569, 0],
                                    [1.0569, 2.1138, 0],
-                                   [0, 0, 0.1366]])
+                                   [0, 0, 0.1366]], dtype=float)
+CALCITE_RECIPROCAL_METRIC.setflags(write=False)
+CALCITE_RECIPROCAL_VOLUME = (math.sqrt(3) / 2 * CALCITE_RECIPROCAL_LATTICE_PARAMETERS[0] ** 2 *
+                             CALCITE_RECIPROCAL_LATTICE_PARAMETERS[2])
+
+# (hkl_1, hkl_2, inner product, angle) in the calcite reciprocal lattice
+RECIPROCAL_CASES = [((1, 0, 0), (0, 1, 0), 1.0569, 60),
+                    ((0, 1, 0), (1, 0, 0), 1.0569, 60),
+                    ((1, 0, 0), (0, 0, 1), 0, 90),
+                    ((1, 0, 0), (1, 4, 2), 6.3414, 49.4084)]
 
 CALCITE_LATTICE_PARAMETERS = (4.99, 4.99, 17.002, 90.0, 90.0, 120.0)
 
 
+def assert_close(actual, desired, decimal=4):
+    assert allclose(actual, desired, rtol=0, atol=1.5 * 10 ** -decimal), (actual, desired)
+
+
+@pytest.fixture(scope="module")
+def calcite_reciprocal():
+    return ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+
+
+@pytest.fixture(scope="module")
+def calcite_direct_reciprocal_pair():
+    direct_lattice = DirectLattice(CALCITE_LATTICE_PARAMETERS)
+    return direct_lattice, direct_lattice.reciprocal()
+
+
 class TestCreatingReciprocalLatticeFromSequence:
     def test_can_create_reciprocal_lattice_from_sequence(self):
         lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
 
         assert lattice.lattice_parameters == CALCITE_RECIPROCAL_LATTICE_PARAMETERS
 
-    def test_error_if_lattice_parameter_missing_from_sequence(self):
-        lattice_parameters_missing_one = CALCITE_RECIPROCAL_LATTICE_PARAMETERS[:5]
-
-        with pytest.raises(ValueError) as exception_info:
-            ReciprocalLattice(lattice_parameters_missing_one)
-        assert str(exception_info.value) == "Missing lattice parameter from input"
-
-    def test_error_if_invalid_lattice_parameter_given(self):
-        invalid_lattice_parameters = CALCITE_RECIPROCAL_LATTICE_PARAMETERS[:5] + ("abcdef",)
-
-        with pytest.raises(ValueError) as exception_info:
+    @pytest.mark.parametrize("invalid_lattice_parameters,message", [
+        pytest.param(CALCITE_RECIPROCAL_LATTICE_PARAMETERS[:5],
+                     "Missing lattice parameter from input", id="missing"),
+        pytest.param(CALCITE_RECIPROCAL_LATTICE_PARAMETERS[:5] + ("abcdef",),
+                     "Invalid lattice parameter gamma_star: abcdef", id="invalid")])
+    def test_error_if_invalid_sequence_given(self, invalid_lattice_parameters, message):
+        with pytest.raises(ValueError, match="^{}$".format(re.escape(message))):
             ReciprocalLattice(invalid_lattice_parameters)
-        assert str(exception_info.value) == "Invalid lattice parameter gamma_star: abcdef"
 
 
 class TestCreatingReciprocalLatticeFromMapping:
@@ -51,12 +73,9 @@ class TestCreatingReciprocalLatticeFromMapping:
 
 
 class TestCreatingReciprocalLatticeFromCIF:
-    def test_can_create_reciprocal_lattice_from_single_datablock_cif(self):
-        lattice = ReciprocalLattice.from_cif(
-            "tests/functional/static/valid_cifs/calcite_icsd.cif")
-
-        assert_almost_equal(lattice.lattice_parameters,
-                            CALCITE_RECIPROCAL_LATTICE_PARAMETERS, decimal=4)
+    def test_can_create_reciprocal_lattice_from_single_datablock_cif(self, calcite_cif_lattice):
+        assert_close(calcite_cif_lattice.lattice_parameters,
+                     CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
 
     def test_error_if_lattice_parameter_is_missing_from_cif(selfs):
         with pytest.raises(ValueError) as exception_info:
@@ -74,14 +93,9 @@ class TestCreatingReciprocalLatticeFromCIF:
             ("__init__() missing keyword argument: 'data_block'. "
              "Required when input CIF has multiple data blocks.")
 
-    def test_can_create_direct_lattice_from_multi_data_block_cif(self):
-        CHFeNOS = ReciprocalLattice.from_cif(
-            "tests/functional/static/valid_cifs/multi_data_block.cif",
-            data_block="data_CSD_CIF_ACAKOF")
-
-        assert_almost_equal(CHFeNOS.lattice_parameters,
-                            [1.0441, 0.7048, 0.6371, 101.9615, 94.5792, 98.5165],
-                            decimal=4)
+    def test_can_create_direct_lattice_from_multi_data_block_cif(self, multi_block_cif_lattice):
+        assert_close(multi_block_cif_lattice.lattice_parameters,
+                     [1.0441, 0.7048, 0.6371, 101.9615, 94.5792, 98.5165])
 
 
 class TestCreatingReciprocalLatticeFromDirectLattice:
@@ -90,58 +104,54 @@ class TestCreatingReciprocalLatticeFromDirectLattice:
         reciprocal_lattice = direct_lattice.reciprocal()
 
         assert isinstance(reciprocal_lattice, ReciprocalLattice)
-        assert_almost_equal(reciprocal_lattice.lattice_parameters,
-                            CALCITE_RECIPROCAL_LATTICE_PARAMETERS,
-                            decimal=4)
+        assert_close(reciprocal_lattice.lattice_parameters,
+                     CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
 
 
 class TestReciprocalSpaceCalculations:
-    def test_lattice_parameters_available_as_attribute(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+    def test_lattice_parameters_available_as_attribute(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
 
         assert lattice.lattice_parameters == CALCITE_RECIPROCAL_LATTICE_PARAMETERS
 
-    def test_calculating_reciprocal_metric_tensor(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+    def test_calculating_reciprocal_metric_tensor(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
 
-        assert_array_almost_equal(lattice.metric, CALCITE_RECIPROCAL_METRIC,
-                                  decimal=4)
+        assert_close(lattice.metric, CALCITE_RECIPROCAL_METRIC)
 
-    def test_calculating_unit_cell_volume(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
-        a_star, b_star, c_star, *_ = CALCITE_RECIPROCAL_LATTICE_PARAMETERS
-        expected_volume = sqrt(3) / 2 * a_star * a_star * c_star
+    def test_calculating_unit_cell_volume(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
 
-        assert_almost_equal(lattice.unit_cell_volume, expected_volume)
+        assert_almost_equal(lattice.unit_cell_volume, CALCITE_RECIPROCAL_VOLUME)
 
-    def test_creating_reciprocal_lattice_vectors(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+    def test_creating_reciprocal_lattice_vectors(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
         v1 = ReciprocalLatticeVector([1, 2, 3], lattice)
         v2 = lattice.vector([1, 2, 3])
         assert v1 == v2
 
-    def test_calculating_length_of_reciprocal_lattice_vector(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+    def test_calculating_length_of_reciprocal_lattice_vector(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
         v1 = ReciprocalLatticeVector([1, 1, 0], lattice)
         v2 = ReciprocalLatticeVector([1, 2, 3], lattice)
 
-        assert_almost_equal(v1.norm(), 2.5182, decimal=4)
-        assert_almost_equal(v2.norm(), 4.0033, decimal=4)
+        assert_close(v1.norm(), 2.5182)
+        assert_close(v2.norm(), 4.0033)
 
-    def test_calculating_inner_product(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+    def test_calculating_inner_product(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
         v1 = ReciprocalLatticeVector([1, 0, 0], lattice)
         v2 = ReciprocalLatticeVector([0, 1, 0], lattice)
         v3 = ReciprocalLatticeVector([0, 0, 1], lattice)
         v4 = ReciprocalLatticeVector([1, 4, 2], lattice)
 
-        assert_almost_equal(v1.inner(v2), 1.0569, decimal=4)
-        assert_almost_equal(v2.inner(v1), 1.0569, decimal=4)
+        assert_close(v1.inner(v2), 1.0569)
+        assert_close(v2.inner(v1), 1.0569)
         assert_almost_equal(v1.inner(v3), 0)
-        assert_almost_equal(v1.inner(v4), 6.3414, decimal=4)
+        assert_close(v1.inner(v4), 6.3414)
 
-    def test_calculating_angle_between_two_vectors(self):
-        lattice = ReciprocalLattice(CALCITE_RECIPROCAL_LATTICE_PARAMETERS)
+    def test_calculating_angle_between_two_vectors(self, calcite_reciprocal):
+        lattice = calcite_reciprocal
         v1 = ReciprocalLatticeVector([1, 0, 0], lattice)
         v2 = ReciprocalLatticeVector([0, 1, 0], lattice)
         v3 = ReciprocalLatticeVector([0, 0, 1], lattice)
@@ -150,11 +160,21 @@ class TestReciprocalSpaceCalculations:
         assert_almost_equal(v1.angle(v2), 60)
         assert_almost_equal(v2.angle(v1), 60)
         assert_almost_equal(v1.angle(v3), 90)
-        assert_almost_equal(v1.angle(v4), 49.4084, decimal=4)
+        assert_close(v1.angle(v4), 49.4084)
 
-    def test_calculating_inner_product_with_direct_lattice_vector(self):
-        direct_lattice = DirectLattice(CALCITE_LATTICE_PARAMETERS)
-        reciprocal_lattice = direct_lattice.reciprocal()
+    def test_calculating_scalar_products_in_one_batch(self, calcite_reciprocal):
+        hkls_1 = array([case[0] for case in RECIPROCAL_CASES])
+        hkls_2 = array([case[1] for case in RECIPROCAL_CASES])
+
+        assert_close(calcite_reciprocal.inner_batch(hkls_1, hkls_2),
+                     [case[2] for case in RECIPROCAL_CASES])
+        assert_close(calcite_reciprocal.angles(hkls_1, hkls_2),
+                     [case[3] for case in RECIPROCAL_CASES])
+        assert_close(calcite_reciprocal.norms([[1, 1, 0], [1, 2, 3]]), [2.5182, 4.0033])
+
+    def test_calculating_inner_product_with_direct_lattice_vector(
+            self, calcite_direct_reciprocal_pair):
+        direct_lattice, reciprocal_lattice = calcite_direct_reciprocal_pair
         v1_direct = DirectLatticeVector([1, 0, 0], direct_lattice)
         v2_direct = DirectLatticeVector([1, 4, 2], direct_lattice)
         v1_reciprocal = ReciprocalLatticeVector([1, 0, 0], reciprocal_lattice)
@@ -165,16 +185,15 @@ class TestReciprocalSpaceCalculations:
         assert_almost_equal(v1_reciprocal.inner(v2_direct), 2 * pi)
         assert_almost_equal(v2_reciprocal.inner(v1_direct), 2 * pi)
 
-    def test_calculating_angle_with_direct_lattice_vector(self):
-        direct_lattice = DirectLattice(CALCITE_LATTICE_PARAMETERS)
-        reciprocal_lattice = direct_lattice.reciprocal()
+    def test_calculating_angle_with_direct_lattice_vector(self, calcite_direct_reciprocal_pair):
+        direct_lattice, reciprocal_lattice = calcite_direct_reciprocal_pair
         v1_direct = DirectLatticeVector([1, 0, 0], direct_lattice)
         v2_direct = DirectLatticeVector([0, 4, 2], direct_lattice)
         v1_reciprocal = ReciprocalLatticeVector([1, 0, 0], reciprocal_lattice)
         v2_reciprocal = ReciprocalLatticeVector([0, 4, 2], reciprocal_lattice)
 
         assert_almost_equal(v1_reciprocal.angle(v1_direct), 30)
-        assert_almost_equal(v2_reciprocal.angle(v2_direct), 57.0690, decimal=4)
+        assert_close(v2_reciprocal.angle(v2_direct), 57.0690)
         assert_almost_equal(v1_reciprocal.angle(v2_direct), 90)
         assert_almost_equal(v2_reciprocal.angle(v1_direct), 90)
 
@@ -1,6 +1,15 @@
+from functools import lru_cache
+
+import pytest
+
 from diffraction.symmetry import PointGroup
 
 
+@lru_cache(maxsize=None)
+def cached_point_group(symbol):
+    return PointGroup(symbol)
+
+
 def test_loading_point_group_from_symbol():
     point_group = PointGroup("432")
 
@@ -15,31 +24,26 @@ def test_loading_point_group_from_number():
     assert point_group.symbol == "4/m"
 
 
-def test_retrieving_point_group_operations_xyz_form():
-    point_group = PointGroup("-6m2")
-
-    assert len(point_group.operators["xyz"]) == 12
-    assert point_group.operators["xyz"][0] == "x,y,z"
-    assert point_group.operators["xyz"][5] == "-x+y,-x,-z"
-    assert point_group.operators["xyz"][8] == "x,x-y,z"
-
-
-def test_retrieving_point_group_operations_matrix_form():
-    point_group = PointGroup("4/m")
+@pytest.mark.parametrize("symbol,form,length,expected_operators", [
+    ("-6m2", "xyz", 12, {0: "x,y,z", 5: "-x+y,-x,-z", 8: "x,x-y,z"}),
+    ("4/m", "matrix", 8, {0: [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+                          3: [[0, 1, 0], [-1, 0, 0], [0, 0, 1]],
+                          5: [[1, 0, 0], [0, 1, 0], [0, 0, -1]]}),
+    ("m-3", "ita", 24, {0: "1", 5: "3+ -x,x,-x", 19: "-3+ -x,-x,x; 0,0,0"})],
+    ids=["xyz", "matrix", "ita"])
+def test_retrieving_point_group_operations(symbol, form, length, expected_operators):
+    operators = cached_point_group(symbol).operators[form]
 
-    assert len(point_group.operators["matrix"]) == 8
-    assert point_group.operators["matrix"][0] == [
-        [1, 0, 0], [0, 1, 0], [0, 0, 1]]
-    assert point_group.operators["matrix"][3] == [
-        [0, 1, 0], [-1, 0, 0], [0, 0, 1]]
-    assert point_group.operators["matrix"][5] == [
-        [1, 0, 0], [0, 1, 0], [0, 0, -1]]
+    assert len(operators) == length
+    for index, expected_operator in expected_operators.items():
+        assert operators[index] == expected_operator
 
 
-def test_retrieving_point_group_operations_ita_form():
-    point_group = PointGroup("m-3")
+def test_applying_point_group_operations_to_vector():
+    point_group = cached_point_group("4/m")
+    vectors = point_group.apply([1, 2, 3])
 
-    assert len(point_group.operators["ita"]) == 24
-    assert point_group.operators["ita"][0] == "1"
-    assert point_group.operators["ita"][5] == "3+ -x,x,-x"
-    assert point_group.operators["ita"][19] == "-3+ -x,-x,x; 0,0,0"
+    assert vectors.shape == (8, 3)
+    assert vectors[0].tolist() == [1, 2, 3]
+    assert vectors[3].tolist() == [2, -1, 3]
+    assert vectors[5].tolist() == [1, 2, -3]
@@ -1,3 +1,4 @@
+import os
 import string
 from unittest import mock
 
@@ -6,11 +7,17 @@ import re
 from collections import OrderedDict
 
 from diffraction.cif.cif import (CIFParser, CIFValidator, CIFParseError, DataBlock,
-                                 INLINE_DATA_ITEM, SEMICOLON_DATA_ITEM, strip_quotes)
+                                 INLINE_DATA_ITEM, SEMICOLON_DATA_ITEM, load_cif,
+                                 _load_parsed_cif, _parse_cif, strip_quotes)
 
 # TODO: add unit tests for load_cif and validate_cif
 
 
+@pytest.fixture
+def open_mock(mocker):
+    return mocker.patch("builtins.open", mock.mock_open())
+
+
 class TestParsingFile:
     def test_datablock_class_abbreviates_raw_data_when_printed(self):
         # test when raw_data is shorter than 18 characters
@@ -20,21 +27,21 @@ class TestParsingFile:
         data_block = DataBlock("header", "a" * 100)
         assert repr(data_block) == "DataBlock('header', '%s...', {})" % ("a" * 15)
 
-    def test_file_contents_are_stored_as_raw_string_attribute(self, mocker):
+    def test_file_contents_are_stored_as_raw_string_attribute(self, open_mock):
         contents = [
             "_data_name_1 data_value_1",
             "_data_name_2 data_value_2",
             "_etc etc",
         ]
-        mocker.patch("builtins.open", mock.mock_open(read_data='\n'.join(contents)))
+        mock.mock_open(open_mock, read_data='\n'.join(contents))
 
         filepath = "/some_directory/some_file.cif"
         p = CIFParser(filepath)
         # make sure correct file was loaded
-        open.assert_called_with(filepath, "r")
+        open_mock.assert_called_with(filepath, "r")
         assert p.raw_data == '\n'.join(contents)
 
-    def test_comments_and_blank_lines_are_stripped_out(self, mocker):
+    def test_comments_and_blank_lines_are_stripped_out(self, open_mock):
         contents = [
             "# Here is a comment on the first line",
             "# Here is another comment. The next line is just whitespace",
@@ -44,14 +51,29 @@ class TestParsingFile:
             "  _another_normal_line starting_with_whitespace",
             '# Final comment ## with # extra hashes ### in ##'
         ]
-        mocker.patch("builtins.open", mock.mock_open(read_data='\n'.join(contents)))
+        mock.mock_open(open_mock, read_data='\n'.join(contents))
         expected_remaining_lines = contents[4:6]
 
         p = CIFParser("/some_directory/some_file.cif")
         p._strip_comments_and_blank_lines()
         assert p.raw_data == "\n".join(expected_remaining_lines)
 
-    def test_file_split_by_data_blocks(self, mocker):
+    def test_trailing_blank_lines_are_stripped_out(self, open_mock):
+        contents = [
+            "_some_normal_line some_value",
+            "prefix#comment attached to a word",
+            "_another_normal_line another_value",
+            "",
+            "   ",
+            ""
+        ]
+        mock.mock_open(open_mock, read_data='\n'.join(contents))
+
+        p = CIFParser("/some_directory/some_file.cif")
+        p._strip_comments_and_blank_lines()
+        assert p.raw_data == "\n".join([contents[0], contents[2]])
+
+    def test_file_split_by_data_blocks(self, open_mock):
         block_1 = [
             "data_block_header",
             "_data_name_A data_value_A",
@@ -69,7 +91,7 @@ class TestParsingFile:
             "_data_name_C data_value_C"
         ]
         contents = block_1 + block_2 + block_3
-        mocker.patch("builtins.open", mock.mock_open(read_data=str("\n".join(contents))))
+        mock.mock_open(open_mock, read_data=str("\n".join(contents)))
         # generate expected output - each data block stored in DataBlock object
         expected = []
         for block in [block_1, block_2, block_3]:
@@ -80,6 +102,23 @@ class TestParsingFile:
         p._extract_data_blocks()
         assert p.data_blocks == expected
 
+    def test_empty_data_block_does_not_absorb_next_data_block(self, open_mock):
+        contents = [
+            "data_empty_block",
+            "data_block_header _data_name_A data_value_A",
+            "_data_name_B data_value_B"
+        ]
+        mock.mock_open(open_mock, read_data=str("\n".join(contents)))
+        expected = [DataBlock("data_empty_block", ""),
+                    DataBlock("data_block_header", "\n".join(["_data_name_A data_value_A",
+                                                              "_data_name_B data_value_B"]))]
+
+        p = CIFParser("/some_directory/some_file.cif")
+        p._extract_data_blocks()
+        assert p.data_blocks == expected
+        assert [data_block.raw_data for data_block in p.data_blocks] == \
+            [data_block.raw_data for data_block in expected]
+
     def test_textual_data_values_are_stripped_of_ending_quotes(self):
         test_data_values = ["'data value with single quotes'",
                             "\"data value with double quotes\"",
@@ -149,6 +188,32 @@ class TestParsingFile:
         data_block.extract_data_items(SEMICOLON_DATA_ITEM)
         assert data_block.raw_data == expected_remaining_data
 
+    def test_semicolon_data_items_are_extracted_line_by_line(self):
+        contents = [
+            "_data_name_1 data_value_1",
+            "_data_name_2",
+            ";",
+            "semicolon text field with",
+            "two lines of text",
+            ";",
+            "_data_name_3 data_value_3",
+            "  _data_name_4",
+            ";",
+            "semicolon text ; field containing ;;; semicolons",
+            ";"
+        ]
+        data_block = DataBlock('data_block_header', "\n".join(contents))
+        regex_data_block = DataBlock('data_block_header', "\n".join(contents))
+
+        data_block.extract_semicolon_data_items()
+        regex_data_block.extract_data_items(SEMICOLON_DATA_ITEM)
+        assert data_block.data_items == {
+            "data_name_2": "semicolon text field with\ntwo lines of text",
+            "data_name_4": "semicolon text ; field containing ;;; semicolons"}
+        assert data_block.raw_data == "\n".join([contents[0], contents[6]])
+        assert data_block.data_items == regex_data_block.data_items
+        assert data_block.raw_data == regex_data_block.raw_data
+
     def test_inline_declared_variables_are_assigned(self, mocker):
         data_items = OrderedDict([
             ("data_name", "value"),
@@ -209,6 +274,27 @@ class TestParsingFile:
         assert strip_quotes_mock.call_count == 21
         assert data_block.data_items == data_items
 
+    def test_extracted_data_names_are_interned(self):
+        contents = [
+            "_inline_data_name value",
+            "_semicolon_data_name",
+            ";",
+            "semicolon text field",
+            ";",
+            "loop_",
+            "_loop_data_name",
+            "loop_value"
+        ]
+        data_block = DataBlock('data_block_header', "\n".join(contents))
+
+        data_block.extract_semicolon_data_items()
+        data_block.extract_data_items(INLINE_DATA_ITEM)
+        data_block.extract_loop_data_items()
+        # the literals below are interned at compile time
+        for data_name in ["inline_data_name", "semicolon_data_name", "loop_data_name"]:
+            extracted_data_name, = [key for key in data_block.data_items if key == data_name]
+            assert extracted_data_name is data_name
+
     def test_parse_method_calls_in_correct_order(self):
         p = mock.Mock(spec=CIFParser)
         data_block = mock.Mock(spec=DataBlock)
@@ -217,12 +303,43 @@ class TestParsingFile:
         expected_calls = [
             mock.call._strip_comments_and_blank_lines(),
             mock.call._extract_data_blocks(),
-            mock.call.extract_data_items(SEMICOLON_DATA_ITEM),
+            mock.call.extract_semicolon_data_items(),
             mock.call.extract_data_items(INLINE_DATA_ITEM),
             mock.call.extract_loop_data_items()
         ]
         assert p.method_calls + data_block.method_calls == expected_calls
 
+    def test_data_blocks_can_be_parsed_one_at_a_time(self, open_mock):
+        contents = [
+            "# a comment",
+            "data_block_header_1",
+            "_data_name_A data_value_A",
+            "data_block_header_2",
+            "_data_name_B",
+            ";",
+            "semicolon text field",
+            ";",
+            "loop_",
+            "_loop_data_name_C",
+            "value_C1",
+            "value_C2"
+        ]
+        mock.mock_open(open_mock, read_data="\n".join(contents))
+        p = CIFParser("/some_directory/some_file.cif")
+        data_blocks = p.iter_data_blocks()
+
+        data_block = next(data_blocks)
+        assert data_block.header == "data_block_header_1"
+        assert data_block.data_items == {"data_name_A": "data_value_A"}
+        data_block = next(data_blocks)
+        assert data_block.header == "data_block_header_2"
+        assert data_block.data_items == {
+            "data_name_B": "semicolon text field",
+            "loop_data_name_C": ["value_C1", "value_C2"]}
+        with pytest.raises(StopIteration):
+            next(data_blocks)
+        assert p.data_blocks == []
+
 
 class TestCIFSyntaxExceptions:
     valid_comments = [
@@ -360,3 +477,43 @@ class TestCIFSyntaxExceptions:
             v.validate()
         assert str(exception_info.value) == \
             'Unclosed semicolon text field on line 4: "Unclosed text field"'
+
+
+class TestLoadingCIF:
+    @pytest.fixture(autouse=True)
+    def clear_cif_cache(self):
+        _load_parsed_cif.cache_clear()
+        yield
+        _load_parsed_cif.cache_clear()
+
+    def test_unchanged_file_is_only_parsed_once(self, tmp_path, mocker):
+        cif_file = tmp_path / "some_file.cif"
+        cif_file.write_text("data_block_header\n_data_name data_value\n")
+        parse_mock = mocker.patch("diffraction.cif.cif._parse_cif", wraps=_parse_cif)
+
+        expected = {"data_block_header": {"data_name": "data_value"}}
+        assert load_cif(str(cif_file)) == expected
+        assert load_cif(str(cif_file)) == expected
+        assert parse_mock.call_count == 1
+
+    def test_modified_file_is_parsed_again(self, tmp_path):
+        cif_file = tmp_path / "some_file.cif"
+        cif_file.write_text("data_block_header\n_data_name data_value\n")
+        load_cif(str(cif_file))
+        cif_file.write_text("data_block_header\n_data_name new_data_value\n")
+        # make sure the modification time differs on coarse clocks
+        file_status = os.stat(str(cif_file))
+        os.utime(str(cif_file), ns=(file_status.st_atime_ns,
+                                    file_status.st_mtime_ns + 10 ** 9))
+
+        assert load_cif(str(cif_file)) == {"data_block_header": {"data_name": "new_data_value"}}
+
+    def test_modifying_loaded_data_does_not_affect_later_loads(self, tmp_path):
+        cif_file = tmp_path / "some_file.cif"
+        cif_file.write_text("data_block_header\nloop_\n_data_name\nvalue_1\nvalue_2\n")
+        cif_data = load_cif(str(cif_file))
+        cif_data["data_block_header"]["data_name"].append("value_3")
+        cif_data["data_block_header"]["another_data_name"] = "another_value"
+
+        assert load_cif(str(cif_file)) == {"data_block_header":
+                                           {"data_name": ["value_1", "value_2"]}}
@@ -6,6 +6,8 @@ import pytest
 from diffraction.cif.helpers import (cif_numerical, get_cif_data, load_data_block,
                                      NUMERICAL_DATA_NAMES, TEXTUAL_DATA_NAMES)
 
+ALL_DATA_NAMES = list(NUMERICAL_DATA_NAMES) + list(TEXTUAL_DATA_NAMES)
+
 
 def fake_num_data(data_names, errors=False, no_data_blocks=1):
     """Generates dummy numerical input cif data for testing"""
@@ -30,23 +32,21 @@ def fake_cif_data(data_names, errors=False, no_data_blocks=1):
     data_values = fake_num_data(num_data_names, errors, no_data_blocks) + \
         fake_text_data(text_data_names, no_data_blocks)
 
-    data = {}
-    for i in range(no_data_blocks):
-        data_items = dict(zip(num_data_names + text_data_names, data_values))
-        data["data_block_{}".format(i)] = data_items
-    return data
+    # every data block shares the same (read-only) data items
+    data_items = dict(zip(num_data_names + text_data_names, data_values))
+    return {"data_block_{}".format(i): data_items for i in range(no_data_blocks)}
 
 
 class TestLoadingDataItemsFromDataBlocks:
     def test_single_datablock_loaded_automatically(self, mocker):
-        input_dict = fake_cif_data(NUMERICAL_DATA_NAMES + TEXTUAL_DATA_NAMES)
+        input_dict = fake_cif_data(ALL_DATA_NAMES)
         mocker.patch("diffraction.cif.helpers.load_cif", return_value=input_dict)
 
         data_items = load_data_block("single/data/block/cif")
         assert data_items == input_dict["data_block_0"]
 
     def test_error_if_data_block_not_given_for_multi_data_blocks(self, mocker):
-        input_dict = fake_cif_data(NUMERICAL_DATA_NAMES + TEXTUAL_DATA_NAMES, no_data_blocks=5)
+        input_dict = fake_cif_data(ALL_DATA_NAMES, no_data_blocks=5)
         mocker.patch("diffraction.cif.helpers.load_cif", return_value=input_dict)
 
         with pytest.raises(TypeError) as exception_info:
@@ -56,7 +56,7 @@ class TestLoadingDataItemsFromDataBlocks:
              "Required when input CIF has multiple data blocks.")
 
     def test_data_block_loads_for_multi_data_blocks(self, mocker):
-        input_dict = fake_cif_data(NUMERICAL_DATA_NAMES + TEXTUAL_DATA_NAMES, no_data_blocks=5)
+        input_dict = fake_cif_data(ALL_DATA_NAMES, no_data_blocks=5)
         mocker.patch("diffraction.cif.helpers.load_cif", return_value=input_dict)
 
         assert load_data_block("multi/data/block/cif", "data_block_0") == \
@@ -71,6 +71,34 @@ class TestLoadingSpecificDataItems:
         assert str(exception_info.value) == \
             "Invalid numerical value in input CIF cell_length_a: {}".format(invalid_value)
 
+    @pytest.mark.parametrize("invalid_value", ["abc", "123@%£", "1232.433.21"])
+    def test_error_if_invalid_numerical_loop_data_in_cif(self, invalid_value):
+        with pytest.raises(ValueError) as exception_info:
+            cif_numerical("atom_site_fract_x", ["0", "0.25706(33)", invalid_value])
+        assert str(exception_info.value) == \
+            "Invalid numerical value in input CIF atom_site_fract_x: {}".format(invalid_value)
+
+    @pytest.mark.parametrize("invalid_value", [None, 1.5])
+    def test_error_if_numerical_data_value_is_not_a_string(self, invalid_value):
+        with pytest.raises(ValueError) as exception_info:
+            cif_numerical("cell_length_a", invalid_value)
+        assert str(exception_info.value) == \
+            "Invalid numerical value in input CIF cell_length_a: {}".format(invalid_value)
+
+    @pytest.mark.parametrize("invalid_value, reported_value", [
+        (None, "None"),
+        ([], "['0', '0.25706(33)', []]")])
+    def test_error_if_numerical_loop_data_value_is_not_a_string(self, invalid_value,
+                                                                reported_value):
+        with pytest.raises(ValueError) as exception_info:
+            cif_numerical("atom_site_fract_x", ["0", "0.25706(33)", invalid_value])
+        assert str(exception_info.value) == \
+            "Invalid numerical value in input CIF atom_site_fract_x: {}".format(reported_value)
+
+    def test_numerical_loop_data_values_converted(self):
+        assert cif_numerical("atom_site_fract_x", ["0", "-1.5", "0.25706(33)"]) == \
+            [0.0, -1.5, 0.25706]
+
     @pytest.mark.parametrize("missing_data_item", "abcdef")
     def test_error_if_parameter_missing_from_cif(self, missing_data_item):
         data_items_with_missing_item = dict(zip("abcdef", range(6)))
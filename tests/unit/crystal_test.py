@@ -78,6 +78,15 @@ class TestCreatingCrystalFromSequence:  # TODO: add test to check space group va
         assert str(c) == "Crystal({0}, '{1}')".format(
             [float(parameter) for parameter in lattice_parameters], space_group)
 
+    def test_space_group_strings_are_shared_between_crystals(self, mocker):
+        *lattice_parameters, space_group = CALCITE_DATA.values()
+        mocker.patch("diffraction.crystal.DirectLattice")
+        c1 = Crystal(lattice_parameters, "".join(space_group))
+        c2 = Crystal(lattice_parameters, "".join(space_group))
+
+        assert c1.space_group == space_group
+        assert c1.space_group is c2.space_group
+
 
 class TestCreatingCrystalFromMapping:
     def test_lattice_parameters_and_space_group_are_assigned(self, mocker):
@@ -112,15 +121,29 @@ class TestCreatingCrystalFromMapping:
 
 class TestCreatingCrystalFromCIF:  # TODO: add test to ensure load sites is called in constructor
     def test_lattice_parameters_and_space_group_are_assigned(self, mocker):
-        mocker.patch("diffraction.crystal.load_data_block", return_value=CALCITE_CIF)
+        load_data_block_mock = mocker.patch("diffraction.crystal.load_data_block",
+                                            return_value=CALCITE_CIF)
         mock_lattice = mocker.Mock(spec=DirectLattice)
-        m = mocker.patch("diffraction.crystal.DirectLattice.from_cif",
+        m = mocker.patch("diffraction.crystal.DirectLattice",
                          return_value=mock_lattice)
 
         c = Crystal.from_cif("some/cif/file.cif", load_sites=False)
-        m.assert_called_once_with("some/cif/file.cif", None)
+        load_data_block_mock.assert_called_once_with("some/cif/file.cif", None)
+        m.assert_called_once_with([4.99, 4.99, 17.002, 90.0, 90.0, 90.0])
         assert c.lattice == mock_lattice
         assert c.space_group == "R -3 c H"
+        assert c.sites == {}
+
+    def test_data_block_loaded_once_when_loading_sites(self, mocker):
+        load_data_block_mock = mocker.patch("diffraction.crystal.load_data_block",
+                                            return_value=CALCITE_CIF)
+        mocker.patch("diffraction.crystal.DirectLattice")
+
+        c = Crystal.from_cif("some/cif/file.cif")
+        load_data_block_mock.assert_called_once_with("some/cif/file.cif", None)
+        expected_sites = {name: Site(ion, position)
+                          for name, (ion, position) in CALCITE_ATOMIC_SITES.items()}
+        assert c.sites == expected_sites
 
     def test_loading_atomic_sites_from_cif(self, mocker):
         mocker.patch("diffraction.crystal.load_data_block", return_value=CALCITE_CIF)
@@ -1,12 +1,17 @@
 from collections import OrderedDict
+import importlib.util
+import math
+import pickle
 
-from numpy import add, array, array_equal, ndarray, pi, sqrt
+from numpy import add, array, array_equal, isnan, ndarray, pi, sqrt
+from numpy.linalg import det, inv
 from numpy.testing import assert_almost_equal, assert_array_almost_equal
 import pytest
 
+import diffraction.lattice
 from diffraction.cif.helpers import NUMERICAL_DATA_VALUE
 from diffraction.lattice import (Lattice, DirectLattice, DirectLatticeVector,
-                                 _to_radians, _to_degrees, metric_tensor,
+                                 _cell_volume, _to_radians, _to_degrees, metric_tensor,
                                  ReciprocalLattice, ReciprocalLatticeVector,
                                  reciprocalise)
 
@@ -66,6 +71,20 @@ class TestUtilityFunctions:
         assert_array_almost_equal(metric_tensor(lattice_parameters),
                                   CALCITE_DIRECT_METRIC)
 
+    def test_metric_tensor_terms_are_zero_for_right_angles(self):
+        metric = metric_tensor((4.99, 4.99, 17.002, 90, 90, 120))
+
+        assert metric[0, 2] == metric[2, 0] == metric[1, 2] == metric[2, 1] == 0
+
+    @pytest.mark.parametrize("lattice_parameters", [
+        tuple(CALCITE_LATTICE.values()),
+        (6.1250, 9.2460, 10.147, 77.16, 83.44, 80.28)])
+    def test_calculating_unit_cell_volume(self, lattice_parameters):
+        expected_volume = sqrt(det(metric_tensor(lattice_parameters)))
+
+        assert_almost_equal(_cell_volume(*_to_radians(lattice_parameters)),
+                            expected_volume)
+
     def test_transforming_to_reciprocal_basis(self):
         lattice_parameters = CALCITE_LATTICE.values()
 
@@ -74,6 +93,43 @@ class TestUtilityFunctions:
                                   tuple(CALCITE_RECIPROCAL_LATTICE.values()),
                                   decimal=4)
 
+    def test_reciprocal_basis_transformation_is_cached(self, mocker):
+        lattice_parameters = (4.5, 5.5, 6.5, 80, 85, 95)
+        reciprocalise(lattice_parameters)
+        m = mocker.patch("diffraction.lattice._to_radians")
+
+        assert reciprocalise(list(lattice_parameters)) == reciprocalise(lattice_parameters)
+        m.assert_not_called()
+
+
+@pytest.fixture(params=["fma", "plain"])
+def lattice_module(request, monkeypatch):
+    """Separate copy of diffraction.lattice built with or without math.fma"""
+    if request.param == "fma":
+        monkeypatch.setattr(math, "fma", lambda x, y, z: x * y + z, raising=False)
+    else:
+        monkeypatch.delattr(math, "fma", raising=False)
+    spec = importlib.util.spec_from_file_location(
+        "diffraction._lattice_" + request.param, diffraction.lattice.__file__)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestVectorKernels:
+    @pytest.mark.parametrize("matrix", [
+        CALCITE_DIRECT_METRIC,
+        metric_tensor((6.1250, 9.2460, 10.147, 77.16, 83.44, 80.28)),
+        metric_tensor((4, 5, 6, 90, 90, 90))])
+    def test_matrix_vector_product(self, lattice_module, matrix):
+        v = (1.0, -2.0, 3.0)
+
+        assert_array_almost_equal(
+            lattice_module._matrix_vector_product(matrix.tolist(), v), matrix.dot(v))
+
+    def test_dot_product(self, lattice_module):
+        assert lattice_module._dot((1.0, -2.0, 3.0), (4.0, 5.0, -6.0)) == -24.0
+
 
 class TestCreatingAbstractLattice:
     cls = FakeAbstractLattice
@@ -101,13 +157,25 @@ class TestCreatingAbstractLattice:
                 "Parameter: '{}' missing from input dictionary".format(
                     missing_parameter)
 
+    def test_error_lists_all_parameters_missing_from_input_dict(self):
+        dict_with_missing_parameters = self.test_dict.copy()
+        missing_parameters = list(self.test_dict.keys())[1::3]
+        for missing_parameter in missing_parameters:
+            del dict_with_missing_parameters[missing_parameter]
+
+        with pytest.raises(ValueError) as exception_info:
+            self.cls.from_dict(dict_with_missing_parameters)
+        assert str(exception_info.value) == \
+            "Parameters: '{}', '{}' missing from input dictionary".format(
+                *missing_parameters)
+
     def test_parameters_are_assigned_with_values_read_from_dict(self, mocker):
         mock = mocker.patch("diffraction.lattice.Lattice.__init__",
                             return_value=None)
         self.cls.from_dict(self.test_dict)
         mock.assert_called_once_with(list(self.test_dict.values()))
 
-    @pytest.mark.parametrize("invalid_value", ["abc", "123@%£", "1232.433.21"])
+    @pytest.mark.parametrize("invalid_value", ["abc", "123@%£", "1232.433.21", None])
     @pytest.mark.parametrize("position", range(6))
     def test_error_if_invalid_lattice_parameter_given(self, invalid_value,
                                                       position, mocker):
@@ -171,7 +239,7 @@ class TestCreatingDirectLattice(TestCreatingAbstractLattice):
                             tuple(self.test_dict.values()))
 
     def test_creating_from_reciprocal_lattice(self, mocker):
-        mock = mocker.MagicMock()
+        mock = mocker.MagicMock(_reciprocal=None)
         mock.lattice_parameters = "reciprocal_lattice_parameters"
         m1 = mocker.patch("diffraction.lattice.reciprocalise",
                           return_value="direct_lattice_parameters")
@@ -181,6 +249,16 @@ class TestCreatingDirectLattice(TestCreatingAbstractLattice):
         m1.assert_called_once_with("reciprocal_lattice_parameters")
         m2.assert_called_once_with("direct_lattice_parameters")
 
+    def test_direct_lattice_is_reused(self):
+        reciprocal_lattice = ReciprocalLattice(tuple(CALCITE_RECIPROCAL_LATTICE.values()))
+        direct_lattice = reciprocal_lattice.direct()
+
+        assert reciprocal_lattice.direct() is direct_lattice
+        assert direct_lattice.reciprocal() is reciprocal_lattice
+        reciprocal_lattice.a_star = 1
+        assert reciprocal_lattice.direct() is not direct_lattice
+        assert direct_lattice.reciprocal() is not reciprocal_lattice
+
 
 class TestCreatingReciprocalLattice(TestCreatingAbstractLattice):
     cls = ReciprocalLattice
@@ -205,7 +283,7 @@ class TestCreatingReciprocalLattice(TestCreatingAbstractLattice):
                             decimal=4)
 
     def test_creating_from_direct_lattice(self, mocker):
-        mock = mocker.MagicMock()
+        mock = mocker.MagicMock(_reciprocal=None)
         mock.lattice_parameters = "direct_lattice_parameters"
         m1 = mocker.patch("diffraction.lattice.reciprocalise",
                           return_value="reciprocal_lattice_parameters")
@@ -215,6 +293,16 @@ class TestCreatingReciprocalLattice(TestCreatingAbstractLattice):
         m1.assert_called_once_with("direct_lattice_parameters")
         m2.assert_called_once_with("reciprocal_lattice_parameters")
 
+    def test_reciprocal_lattice_is_reused(self):
+        direct_lattice = DirectLattice(tuple(CALCITE_LATTICE.values()))
+        reciprocal_lattice = direct_lattice.reciprocal()
+
+        assert direct_lattice.reciprocal() is reciprocal_lattice
+        assert reciprocal_lattice.direct() is direct_lattice
+        direct_lattice.a = 1
+        assert direct_lattice.reciprocal() is not reciprocal_lattice
+        assert reciprocal_lattice.direct() is not direct_lattice
+
 
 class TestAccessingComputedProperties:
     # tests both DirectLattice and ReciprocalLattice objects
@@ -251,29 +339,124 @@ class TestAccessingComputedProperties:
                                                              lattice,
                                                              lattice_class):
         lattice_parameters = tuple(lattice.values())
-        mock = mocker.MagicMock(lattice_parameters=lattice_parameters)
         m = mocker.patch("diffraction.lattice.metric_tensor")
-        mock.metric = lattice_class.metric
+        test_lattice = lattice_class(lattice_parameters)
 
-        mock.metric.fget(mock)
+        test_lattice.metric
         m.assert_called_once_with(lattice_parameters)
 
-    @pytest.mark.parametrize("lattice, lattice_class, metric, cell_volume", [
-        (CALCITE_LATTICE, DirectLattice,
-         CALCITE_DIRECT_METRIC, CALCITE_DIRECT_CELL_VOLUME),
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_lattice_metric_is_cached(self, lattice, lattice_class):
+        test_lattice = lattice_class(tuple(lattice.values()))
+
+        assert test_lattice.metric is test_lattice.metric
+        assert test_lattice.inverse_metric is test_lattice.inverse_metric
+        assert_array_almost_equal(test_lattice.inverse_metric,
+                                  inv(test_lattice.metric))
+        with pytest.raises(ValueError):
+            test_lattice.metric[0, 0] = 1
+
+    @pytest.mark.parametrize("lattice, lattice_class, parameter", [
+        (CALCITE_LATTICE, DirectLattice, 'a'),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice, 'a_star')])
+    def test_lattice_metric_recalculated_if_lattice_parameter_changed(
+            self, mocker, lattice, lattice_class, parameter):
+        test_lattice = lattice_class(tuple(lattice.values()))
+        test_lattice.metric
+        test_lattice.unit_cell_volume
+        m = mocker.patch("diffraction.lattice.metric_tensor")
+        expected_lattice_parameters = (10,) + tuple(lattice.values())[1:]
+
+        setattr(test_lattice, parameter, 10)
+        test_lattice.metric
+        m.assert_called_once_with(expected_lattice_parameters)
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_lattice_can_be_pickled(self, lattice, lattice_class):
+        test_lattice = lattice_class(tuple(lattice.values()))
+        test_lattice.metric
+        unpickled_lattice = pickle.loads(pickle.dumps(test_lattice))
+
+        assert unpickled_lattice.lattice_parameters == test_lattice.lattice_parameters
+        assert_array_almost_equal(unpickled_lattice.metric, test_lattice.metric)
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_lattice_equivalence(self, lattice, lattice_class):
+        lattice_1 = lattice_class(tuple(lattice.values()))
+        lattice_2 = lattice_class(tuple(lattice.values()))
+        lattice_3 = lattice_class((1, 2, 3, 90, 90, 90))
+
+        assert lattice_1 == lattice_2
+        assert hash(lattice_1) == hash(lattice_2)
+        assert lattice_1 != lattice_3
+        assert lattice_1 != FakeAbstractLattice(tuple(lattice.values()))
+
+    @pytest.mark.parametrize("lattice, lattice_class, cell_volume", [
+        (CALCITE_LATTICE, DirectLattice, CALCITE_DIRECT_CELL_VOLUME),
         (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice,
-         CALCITE_RECIPROCAL_METRIC, CALCITE_RECIPROCAL_CELL_VOLUME)])
-    def test_unit_cell_volume_is_calculated_correctly(self, mocker, lattice,
+         CALCITE_RECIPROCAL_CELL_VOLUME)])
+    def test_unit_cell_volume_is_calculated_correctly(self, lattice,
                                                       lattice_class,
-                                                      metric, cell_volume):
-        mock = mocker.MagicMock(**lattice)
-        mock.unit_cell_volume = lattice_class.unit_cell_volume
-        mock.metric = metric
+                                                      cell_volume):
+        test_lattice = lattice_class(tuple(lattice.values()))
 
-        assert_almost_equal(mock.unit_cell_volume.fget(mock),
+        assert_almost_equal(test_lattice.unit_cell_volume,
                             cell_volume, decimal=4)
 
 
+class TestBatchVectorCalculations:
+    # tests both DirectLattice and ReciprocalLattice objects
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_calculating_norms_of_many_vectors(self, lattice, lattice_class):
+        test_lattice = lattice_class(tuple(lattice.values()))
+        vectors = [[1, 0, 0], [1, 1, 0], [1, 2, 3], [-2, 0, 1]]
+        expected_norms = [DirectLatticeVector(vector, test_lattice).norm()
+                          for vector in vectors]
+
+        assert_array_almost_equal(test_lattice.norms(vectors), expected_norms)
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_calculating_inner_products_of_many_vectors(self, lattice,
+                                                        lattice_class):
+        test_lattice = lattice_class(tuple(lattice.values()))
+        vectors_1 = [[1, 0, 0], [1, 1, 0], [1, 2, 3], [-2, 0, 1]]
+        vectors_2 = [[0, 1, 0], [1, -1, 0], [1, 1, 1], [3, 2, 1]]
+        expected_inner_products = [
+            DirectLatticeVector(u, test_lattice).inner(
+                DirectLatticeVector(v, test_lattice))
+            for u, v in zip(vectors_1, vectors_2)]
+
+        assert_array_almost_equal(test_lattice.inner_batch(vectors_1, vectors_2),
+                                  expected_inner_products)
+
+    @pytest.mark.parametrize("lattice, lattice_class", [
+        (CALCITE_LATTICE, DirectLattice),
+        (CALCITE_RECIPROCAL_LATTICE, ReciprocalLattice)])
+    def test_calculating_angles_between_many_vectors(self, lattice,
+                                                     lattice_class):
+        test_lattice = lattice_class(tuple(lattice.values()))
+        vectors_1 = [[1, 0, 0], [1, 1, 0], [1, 2, 3], [-3, -2, -3]]
+        vectors_2 = [[0, 1, 0], [1, -1, 0], [1, 1, 1], [-6, -4, -6]]
+        expected_angles = [
+            DirectLatticeVector(u, test_lattice).angle(
+                DirectLatticeVector(v, test_lattice))
+            for u, v in zip(vectors_1, vectors_2)]
+
+        assert_array_almost_equal(test_lattice.angles(vectors_1, vectors_2),
+                                  expected_angles)
+
+
 class TestDirectLatticeVectorCreationAndMagicMethods:
     lattice_cls = DirectLattice
     cls = DirectLatticeVector
@@ -291,14 +474,35 @@ class TestDirectLatticeVectorCreationAndMagicMethods:
         v2 = self.lattice_cls.vector(lattice, [1, 2, 3])
         assert v1 == v2
 
-    def test_lattice_attribute_persists_when_new_array_created(self, mocker):
+    def test_lattice_attribute_persists_when_new_vector_created(self, mocker):
         lattice = mocker.MagicMock()
 
         v1 = self.cls([1, 0, 0], lattice)
         v2 = 2 * v1
-        v3 = v1.copy()
-        assert v2.lattice == lattice
-        assert v3.lattice == lattice
+        v3 = -v1
+        assert v2 == self.cls([2, 0, 0], lattice)
+        assert v3 == self.cls([-1, 0, 0], lattice)
+        assert type(v2) is type(v3) is self.cls
+
+    def test_lattice_vectors_can_only_be_multiplied_by_scalars(self, mocker):
+        lattice = mocker.MagicMock()
+        v1 = self.cls([1, 2, 3], lattice)
+
+        assert v1 * 2.5 == 2.5 * v1 == self.cls([2.5, 5, 7.5], lattice)
+        with pytest.raises(TypeError):
+            v1 * [1, 2, 3]
+        with pytest.raises(TypeError):
+            [1, 2, 3] * v1
+        with pytest.raises(TypeError):
+            v1 * v1
+
+    def test_lattice_vector_can_be_converted_to_array(self, mocker):
+        lattice = mocker.MagicMock()
+        v1 = self.cls([1, 2, 3], lattice)
+
+        assert array_equal(array(v1), [1, 2, 3])
+        assert list(v1) == [1, 2, 3]
+        assert v1[2] == 3
 
     def test_direct_lattice_vector_equivalence(self, mocker):
         lattice_1 = mocker.MagicMock()
@@ -312,6 +516,15 @@ class TestDirectLatticeVectorCreationAndMagicMethods:
         assert v1 != v3
         assert v1 != v4
 
+    def test_equal_lattice_vectors_have_equal_hashes(self, mocker):
+        lattice = mocker.MagicMock()
+        v1 = self.cls([1, 0, 0], lattice)
+        v2 = self.cls([1, 0, 0], lattice)
+        v3 = self.cls([0, 1, 0], lattice)
+
+        assert hash(v1) == hash(v2)
+        assert len({v1, v2, v3}) == 2
+
     def test_adding_and_subtracting_direct_lattice_vectors(self, mocker):
         lattice = mocker.MagicMock()
         v1 = self.cls([1, 0, 0], lattice)
@@ -364,6 +577,42 @@ class TestDirectLatticeVectorCalculations:
         assert_almost_equal(v1.norm(), 4.99)
         assert_almost_equal(v2.norm(), 51.7330874)
 
+    def test_metric_product_is_recalculated_if_lattice_changed(self):
+        lattice = DirectLattice(tuple(CALCITE_LATTICE.values()))
+        v1 = DirectLatticeVector([1, 1, 0], lattice)
+        assert_almost_equal(v1.norm(), 4.99)
+
+        lattice.a = lattice.b = 10
+        assert_almost_equal(v1.norm(), 10)
+
+    def test_angle_with_zero_vector_is_nan(self, mocker):
+        lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
+        v1 = DirectLatticeVector([1, 0, 0], lattice)
+        v2 = DirectLatticeVector([0, 0, 0], lattice)
+
+        assert isnan(v1.angle(v2))
+        assert isnan(v2.angle(v1))
+        assert isnan(v2.angle(v2))
+
+    def test_metric_product_is_recalculated_if_components_changed(self, mocker):
+        lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
+        v1 = DirectLatticeVector([1, 0, 0], lattice)
+        v2 = DirectLatticeVector([0, 0, 1], lattice)
+        assert_almost_equal(v1.norm(), 4.99)
+
+        v1.components = (0, 0, 1)
+        assert_almost_equal(v1.norm(), 17.002)
+        assert_almost_equal(v1.inner(v2), 289.068004)
+        assert_almost_equal(v1.angle(v2), 0)
+
+    def test_calculating_norm_and_inner_product_with_diagonal_metric(self, mocker):
+        lattice = mocker.MagicMock(metric=metric_tensor((2, 3, 4, 90, 90, 90)))
+        v1 = DirectLatticeVector([1, 1, 1], lattice)
+        v2 = DirectLatticeVector([1, -2, 3], lattice)
+
+        assert_almost_equal(v1.norm(), sqrt(29))
+        assert_almost_equal(v1.inner(v2), 34)
+
     def test_error_if_calculating_inner_product_or_angle_with_different_lattices(self, mocker):
         lattice_1 = mocker.MagicMock()
         lattice_2 = mocker.MagicMock()
@@ -403,6 +652,14 @@ class TestDirectLatticeVectorCalculations:
 
         assert_almost_equal(v1.angle(v2), result)
 
+    def test_angle_between_parallel_vectors_is_zero(self, mocker):
+        lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
+        v1 = DirectLatticeVector([-3, -2, -3], lattice)
+        v2 = DirectLatticeVector([-6, -4, -6], lattice)
+
+        assert_almost_equal(v1.angle(v2), 0)
+        assert_almost_equal(v1.angle(-v2), 180)
+
 
 class TestReciprocalLatticeVectorCalculations:
     def test_calculating_norm_of_reciprocal_lattice_vector(self, mocker):
@@ -455,8 +712,10 @@ class TestReciprocalLatticeVectorCalculations:
 
 class TestDirectAndReciprocalLatticeVectorCalculations:
     def test_error_if_calculating_inner_product_or_angle_with_unreciprocal_lattices(self, mocker):
-        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
-        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC * 1.02)
+        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC,
+                                          inverse_metric=inv(CALCITE_DIRECT_METRIC))
+        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC * 1.02,
+                                              inverse_metric=inv(CALCITE_RECIPROCAL_METRIC * 1.02))
         direct_vector = DirectLatticeVector([1, 0, 0], direct_lattice)
         reciprocal_vector = ReciprocalLatticeVector([0, 2, 3], reciprocal_lattice)
 
@@ -476,8 +735,10 @@ class TestDirectAndReciprocalLatticeVectorCalculations:
         ([1, 2, 3], [0, 0, 1], 6 * pi)])
     def test_calculating_inner_product_of_direct_and_reciprocal_lattice_vectors(
             self, mocker, uvw, hkl, result):
-        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
-        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC,
+                                          inverse_metric=inv(CALCITE_DIRECT_METRIC))
+        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC,
+                                              inverse_metric=inv(CALCITE_RECIPROCAL_METRIC))
         direct_vector = DirectLatticeVector(uvw, direct_lattice)
         reciprocal_vector = ReciprocalLatticeVector(hkl, reciprocal_lattice)
 
@@ -491,8 +752,10 @@ class TestDirectAndReciprocalLatticeVectorCalculations:
         ([1, 2, 3], [0, 0, 1], 9.6527)])
     def test_calculating_angle_between_direct_and_reciprocal_lattice_vectors(
             self, mocker, uvw, hkl, result):
-        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC)
-        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC)
+        direct_lattice = mocker.MagicMock(metric=CALCITE_DIRECT_METRIC,
+                                          inverse_metric=inv(CALCITE_DIRECT_METRIC))
+        reciprocal_lattice = mocker.MagicMock(metric=CALCITE_RECIPROCAL_METRIC,
+                                              inverse_metric=inv(CALCITE_RECIPROCAL_METRIC))
         direct_vector = DirectLatticeVector(uvw, direct_lattice)
         reciprocal_vector = ReciprocalLatticeVector(hkl, reciprocal_lattice)
 
@@ -1,6 +1,12 @@
+import copy
+import os
+from unittest import mock
+
 import pytest
 
 from diffraction import PointGroup
+from diffraction.symmetry import (POINT_GROUP_DATA_DIRECTORY,
+                                  _point_group_matrices, _read_point_group_file)
 
 TEST_POINT_GROUP = {
     "number": 2, "symbol": "-1",
@@ -11,6 +17,15 @@ TEST_POINT_GROUP = {
 }
 
 
+@pytest.fixture(autouse=True)
+def clear_point_group_cache():
+    _read_point_group_file.cache_clear()
+    _point_group_matrices.cache_clear()
+    yield
+    _read_point_group_file.cache_clear()
+    _point_group_matrices.cache_clear()
+
+
 class TestCreatingPointGroups:
     def test_error_if_neither_symbol_nor_number_is_given(self):
         with pytest.raises(ValueError) as exception:
@@ -19,31 +34,41 @@ class TestCreatingPointGroups:
                                         "point group number must be given.")
 
     def test_operations_loaded_from_correct_file_for_given_symbol(self, mocker):
-        open_mock = mocker.patch(
-            "diffraction.symmetry.pkg_resources.resource_string",
-            return_value="json_string")
+        open_mock = mocker.patch("builtins.open",
+                                 mock.mock_open(read_data="json_string"))
         json_mock = mocker.patch("diffraction.symmetry.json.loads",
                                  return_value=TEST_POINT_GROUP)
 
         PointGroup._load_point_group_data("-6m2", None)
-        open_mock.assert_called_once_with("diffraction.symmetry",
-                                          "static/point_groups/26.json")
+        open_mock.assert_called_once_with(
+            os.path.join(POINT_GROUP_DATA_DIRECTORY, "26.json"), "r")
         json_mock.assert_called_once_with("json_string")
 
     def test_operations_loaded_from_correct_file_for_given_number(self, mocker):
-        open_mock = mocker.patch(
-            "diffraction.symmetry.pkg_resources.resource_string",
-            return_value="json_string")
+        open_mock = mocker.patch("builtins.open",
+                                 mock.mock_open(read_data="json_string"))
         json_mock = mocker.patch("diffraction.symmetry.json.loads",
                                  return_value=TEST_POINT_GROUP)
 
         PointGroup._load_point_group_data(None, 26)
-        open_mock.assert_called_once_with("diffraction.symmetry",
-                                          "static/point_groups/26.json")
+        open_mock.assert_called_once_with(
+            os.path.join(POINT_GROUP_DATA_DIRECTORY, "26.json"), "r")
+        json_mock.assert_called_once_with("json_string")
+
+    def test_point_group_file_only_read_once(self, mocker):
+        open_mock = mocker.patch("builtins.open",
+                                 mock.mock_open(read_data="json_string"))
+        json_mock = mocker.patch("diffraction.symmetry.json.loads",
+                                 return_value=TEST_POINT_GROUP)
+
+        PointGroup._load_point_group_data("-1", None)
+        PointGroup._load_point_group_data(None, 2)
+        open_mock.assert_called_once_with(
+            os.path.join(POINT_GROUP_DATA_DIRECTORY, "2.json"), "r")
         json_mock.assert_called_once_with("json_string")
 
     def test_point_attributes_are_loaded_correctly(self, mocker):
-        mocker.patch("diffraction.symmetry.pkg_resources.resource_string")
+        mocker.patch("builtins.open", mock.mock_open())
         mocker.patch("diffraction.symmetry.json.loads",
                      return_value=TEST_POINT_GROUP)
 
@@ -52,6 +77,28 @@ class TestCreatingPointGroups:
         assert symbol == TEST_POINT_GROUP["symbol"]
         assert operators == TEST_POINT_GROUP["operators"]
 
+    def test_modifying_operators_does_not_affect_other_instances(self, mocker):
+        mocker.patch("builtins.open", mock.mock_open())
+        mocker.patch("diffraction.symmetry.json.loads",
+                     return_value=copy.deepcopy(TEST_POINT_GROUP))
+
+        _, _, operators = PointGroup._load_point_group_data("-1", None)
+        operators["xyz"].append("junk")
+        operators["matrix"][0][0][0] = 5
+
+        _, _, operators = PointGroup._load_point_group_data("-1", None)
+        assert operators == TEST_POINT_GROUP["operators"]
+
+    def test_applying_symmetry_operators_to_vector(self, mocker):
+        mocker.patch("builtins.open", mock.mock_open())
+        mocker.patch("diffraction.symmetry.json.loads",
+                     return_value=TEST_POINT_GROUP)
+        point_group = PointGroup("-1")
+
+        assert point_group.matrices.shape == (2, 3, 3)
+        assert point_group.matrices.dtype == "int8"
+        assert point_group.apply([1, 2, 3]).tolist() == [[1, 2, 3], [-1, -2, -3]]
+
     def test_string_representation_of_point_group(self, mocker):
         point_group_mock = mocker.MagicMock(symbol="6/mmm")
         point_group_mock.__repr__ = PointGroup.__repr__